@@ -6,14 +6,20 @@ for easy modification and deployment configuration.
 """
 
 import json
+from types import MappingProxyType
 from pydantic_settings import BaseSettings
 from pydantic import Field, computed_field
-from typing import Dict, List, Optional
-from functools import lru_cache
+from typing import List, Mapping, NamedTuple, Optional, Tuple
+from functools import cached_property
 
 
 class Settings(BaseSettings):
-    """Application settings with environment variable support."""
+    """
+    Application settings with environment variable support.
+
+    Settings are frozen: they are read from the environment once and are
+    shared read-only by every request handler.
+    """
 
     # Service Configuration
     app_name: str = "ileterate Grammar API"
@@ -24,6 +30,8 @@ class Settings(BaseSettings):
     # LanguageTool Configuration
     languagetool_url: str = "http://localhost:8081/v2"
     languagetool_timeout: int = 30
+    languagetool_chunk_threshold: int = 4000  # Split longer texts into parallel checks
+    languagetool_max_concurrency: int = 8  # Parallel chunk requests per text
 
     # LLM Configuration
     llm_url: str = "http://localhost:1234/v1/chat/completions"
@@ -32,12 +40,14 @@ class Settings(BaseSettings):
     llm_temperature: float = 0.1  # Low for deterministic output
     llm_max_tokens: int = 2048
     llm_timeout: int = 60
+    llm_stream: bool = True  # Stream completions and stop once the JSON closes
 
     # API Security
     api_key: Optional[str] = Field(default=None, description="API key for authentication")
     encryption_enabled: bool = Field(default=False, description="Enable E2E encryption")
     rsa_private_key_path: Optional[str] = None
     rsa_public_key_path: Optional[str] = None
+    x25519_private_key_path: Optional[str] = None
 
     # Rate Limiting
     rate_limit_enabled: bool = True
@@ -54,15 +64,17 @@ class Settings(BaseSettings):
     # Can be set as comma-separated string: "https://example.com,https://other.com"
     # Or as JSON array: '["https://example.com","https://other.com"]'
     # Or just "*" for all origins
+    # Disable entirely for non-browser deployments to drop the middleware
+    cors_enabled: bool = True
     cors_origins_raw: str = Field(default="*", validation_alias="cors_origins")
     cors_allow_credentials: bool = True
     cors_allow_methods: List[str] = ["*"]
     cors_allow_headers: List[str] = ["*"]
 
     @computed_field
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
-        """Parse CORS origins from string."""
+        """Parse CORS origins from string (once, settings are frozen)."""
         v = self.cors_origins_raw.strip()
         # Handle wildcard
         if v == "*":
@@ -80,80 +92,93 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_prefix = "GRAMMAR_"
         case_sensitive = False
-
-
-# Language Configuration
-SUPPORTED_LANGUAGES: Dict[str, dict] = {
-    "nl": {
-        "code": "nl",
-        "name": "Dutch",
-        "native_name": "Nederlands",
-        "languagetool_code": "nl",
-        "examples": [
+        frozen = True
+
+
+class LanguageRecord(NamedTuple):
+    """Static configuration for a supported language."""
+    code: str
+    name: str
+    native_name: str
+    languagetool_code: str
+    examples: Tuple[str, ...] = ()
+
+
+# Language Configuration (read-only after import)
+SUPPORTED_LANGUAGES: Mapping[str, LanguageRecord] = MappingProxyType({
+    "nl": LanguageRecord(
+        code="nl",
+        name="Dutch",
+        native_name="Nederlands",
+        languagetool_code="nl",
+        examples=(
             "Ik heb de boek gelezen.",
             "Hij loop naar huis.",
             "Zij is naar school gegaan gisteren."
-        ]
-    },
-    "en": {
-        "code": "en",
-        "name": "English",
-        "native_name": "English",
-        "languagetool_code": "en-US",
-        "examples": [
+        )
+    ),
+    "en": LanguageRecord(
+        code="en",
+        name="English",
+        native_name="English",
+        languagetool_code="en-US",
+        examples=(
             "I has been working here.",
             "Their going to the store.",
             "The informations is incorrect."
-        ]
-    },
-    "de": {
-        "code": "de",
-        "name": "German",
-        "native_name": "Deutsch",
-        "languagetool_code": "de-DE",
-        "examples": [
+        )
+    ),
+    "de": LanguageRecord(
+        code="de",
+        name="German",
+        native_name="Deutsch",
+        languagetool_code="de-DE",
+        examples=(
             "Ich habe das Buch gelest.",
             "Er gehen nach Hause.",
             "Das Auto ist rot gewesen."
-        ]
-    },
-    "fr": {
-        "code": "fr",
-        "name": "French",
-        "native_name": "Français",
-        "languagetool_code": "fr",
-        "examples": [
+        )
+    ),
+    "fr": LanguageRecord(
+        code="fr",
+        name="French",
+        native_name="Français",
+        languagetool_code="fr",
+        examples=(
             "Je suis allé au magasin hier.",
             "Il a mangé les pommes.",
             "Elle est très belle."
-        ]
-    },
-    "es": {
-        "code": "es",
-        "name": "Spanish",
-        "native_name": "Español",
-        "languagetool_code": "es",
-        "examples": [
+        )
+    ),
+    "es": LanguageRecord(
+        code="es",
+        name="Spanish",
+        native_name="Español",
+        languagetool_code="es",
+        examples=(
             "Yo tuve un problema ayer.",
             "El libro es muy interesante.",
             "Ella ha ido al mercado."
-        ]
-    }
-}
+        )
+    )
+})
 
-# Tone Descriptions for LLM prompts
-TONE_DESCRIPTIONS: Dict[str, str] = {
+# Tone Descriptions for LLM prompts (read-only after import)
+TONE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
     "neutral": "Use a balanced, standard tone",
     "formal": "Use formal, professional language appropriate for business or academic contexts",
     "casual": "Use relaxed, conversational language",
     "academic": "Use scholarly language with precise terminology"
-}
+})
 
 # Default language
 DEFAULT_LANGUAGE = "nl"
 
 
-@lru_cache()
+# Settings are frozen and read from the environment exactly once
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the shared settings instance."""
+    return SETTINGS
@@ -9,11 +9,15 @@ Version: 1.0.0
 License: MIT
 """
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, status, Depends
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Response, status, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
+import orjson
 
 from .config import get_settings, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
 from .models import CheckRequest, CheckMode, Tone
@@ -22,10 +26,12 @@ from .models.response import (
     LanguageInfo,
     HealthResponse
 )
-from .services.pipeline import GrammarPipeline
+from .services.pipeline import GrammarPipeline, get_pipeline
 from .utils.cache import get_cache
 from .middleware.auth import api_key_middleware
-from .middleware.encryption import encryption_service, EncryptionMiddleware
+from .middleware.encryption import (
+    encryption_service, EncryptionMiddleware, X25519_PAYLOAD_VERSION
+)
 
 # Configure logging
 settings = get_settings()
@@ -35,27 +41,117 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Language lookups are static, so build the membership set and the
+# error-message rendering once instead of per request
+_SUPPORTED_LANG_SET = frozenset(SUPPORTED_LANGUAGES)
+_UNSUPPORTED_LANG_SUFFIX = f". Supported: {list(SUPPORTED_LANGUAGES)}"
+_VERSION = settings.app_version
+
+
+async def _noop_auth() -> None:
+    """Auth dependency used when no API key is configured."""
+    return None
+
+
+# Skip APIKeyHeader resolution entirely when authentication is disabled
+_auth_dep = api_key_middleware if settings.api_key else _noop_auth
+
+
 # Global pipeline instance
 pipeline: GrammarPipeline = None
 
 
+class _HealthCache:
+    """
+    Short-lived memo of the last service probe result.
+
+    Monitors polling /health should not each trigger network probes to
+    LanguageTool and the LLM. Concurrent callers coalesce behind the lock,
+    so at most one probe is in flight at a time.
+    """
+
+    ttl: float = 2.0
+
+    def __init__(self):
+        self.timestamp: float = 0.0
+        self.result: Optional[dict] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> dict:
+        """Return the cached service status, probing if it has expired."""
+        if self.result is not None and time.monotonic() - self.timestamp < self.ttl:
+            return self.result
+
+        async with self._lock:
+            # Another request may have refreshed while we waited
+            if self.result is not None and time.monotonic() - self.timestamp < self.ttl:
+                return self.result
+
+            self.result = await pipeline.check_services()
+            self.timestamp = time.monotonic()
+            return self.result
+
+
+_health_cache = _HealthCache()
+
+# Static language responses, validated and encoded once at startup
+_LANGUAGES_BYTES: bytes = b"[]"
+_LANGUAGE_BYTES_BY_CODE: dict[str, bytes] = {}
+
+# Pre-encoded bodies for responses that never change during the process
+_ROOT_BYTES: bytes = b""
+_PUBLIC_KEY_BYTES: Optional[bytes] = None
+
+
+async def _background_service_check() -> None:
+    """Probe external services at startup and log their status."""
+    service_status = await _health_cache.get()
+    logger.info("Service status: %s", service_status)
+
+    if not service_status["languagetool"]:
+        logger.warning(
+            "LanguageTool is not available! "
+            "Make sure it's running on the configured URL."
+        )
+
+    if not service_status["llm"]:
+        logger.warning(
+            "LLM is not available! "
+            "Will use rule-based fallback for corrections."
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global pipeline
+    global pipeline, _LANGUAGES_BYTES, _LANGUAGE_BYTES_BY_CODE
+    global _ROOT_BYTES, _PUBLIC_KEY_BYTES
 
     # Startup
     logger.info("Starting ileterate Grammar API...")
-    logger.info(f"Version: {settings.app_version}")
-    logger.info(f"Debug mode: {settings.debug}")
+    logger.info("Version: %s", settings.app_version)
+    logger.info("Debug mode: %s", settings.debug)
 
     # Initialize encryption if enabled
     if settings.encryption_enabled:
         if encryption_service.initialize(
             private_key_path=settings.rsa_private_key_path,
-            public_key_path=settings.rsa_public_key_path
+            public_key_path=settings.rsa_public_key_path,
+            x25519_private_key_path=settings.x25519_private_key_path
         ):
             logger.info("Encryption service initialized")
+            public_key_info = {
+                "public_key": encryption_service.get_public_key_pem(),
+                "algorithm": "RSA-OAEP-SHA256",
+                "key_encryption": encryption_service.key_encryption,
+                "version": encryption_service.payload_version,
+            }
+            # Only advertised when X25519 key agreement is enabled
+            x25519_public_key = encryption_service.get_x25519_public_key()
+            if x25519_public_key:
+                public_key_info["x25519_public_key"] = x25519_public_key
+                public_key_info["x25519_version"] = X25519_PAYLOAD_VERSION
+            _PUBLIC_KEY_BYTES = orjson.dumps(public_key_info)
         else:
             logger.warning("Encryption enabled but failed to initialize")
 
@@ -65,29 +161,49 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("API key authentication: DISABLED (set GRAMMAR_API_KEY to enable)")
 
-    # Initialize pipeline
-    pipeline = GrammarPipeline()
-
-    # Check services
-    service_status = await pipeline.check_services()
-    logger.info(f"Service status: {service_status}")
+    _ROOT_BYTES = orjson.dumps({
+        "name": settings.app_name,
+        "version": settings.app_version,
+        "description": "ileterate - Multilingual Grammar Checking API",
+        "documentation": "/docs" if settings.debug else "Disabled in production",
+        "endpoints": {
+            "check": "/check",
+            "languages": "/languages",
+            "health": "/health",
+            "public_key": "/security/public-key"
+        },
+        "authentication": "API key required" if settings.api_key else "Disabled"
+    })
+
+    # Build language info once; the configuration is static, so the
+    # per-request response_model validation and encoding can be skipped
+    languages = [
+        LanguageInfo(
+            code=config.code,
+            name=config.name,
+            native_name=config.native_name,
+            examples=list(config.examples)
+        ).model_dump()
+        for config in SUPPORTED_LANGUAGES.values()
+    ]
+    _LANGUAGES_BYTES = orjson.dumps(languages)
+    _LANGUAGE_BYTES_BY_CODE = {
+        language["code"]: orjson.dumps(language) for language in languages
+    }
 
-    if not service_status["languagetool"]:
-        logger.warning(
-            "LanguageTool is not available! "
-            "Make sure it's running on the configured URL."
-        )
+    # Initialize pipeline (shared with any other caller of get_pipeline)
+    pipeline = get_pipeline()
 
-    if not service_status["llm"]:
-        logger.warning(
-            "LLM is not available! "
-            "Will use rule-based fallback for corrections."
-        )
+    # Probe services in the background so startup is not blocked behind
+    # LanguageTool/LLM timeouts; /health converges once the probe lands
+    service_check = asyncio.create_task(_background_service_check())
 
     yield
 
     # Shutdown
     logger.info("Shutting down ileterate Grammar API...")
+    service_check.cancel()
+    await pipeline.aclose()
     get_cache().clear()
 
 
@@ -116,24 +232,28 @@ If API key is configured, include the `X-API-Key` header in all requests.
 ### Encryption
 For E2E encryption, use `Content-Type: application/x-encrypted` for requests
 and `Accept: application/x-encrypted` for responses.
+Use `application/x-encrypted-binary` instead for length-prefixed binary
+framing without the base64 JSON envelope.
 
 ### Default Language
 The default language is **Dutch (nl)**.
     """,
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=settings.cors_allow_credentials,
-    allow_methods=settings.cors_allow_methods,
-    allow_headers=settings.cors_allow_headers,
-)
+# Configure CORS (skipped for non-browser deployments)
+if settings.cors_enabled:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=settings.cors_allow_credentials,
+        allow_methods=settings.cors_allow_methods,
+        allow_headers=settings.cors_allow_headers,
+    )
 
 # Add encryption middleware if enabled
 if settings.encryption_enabled:
@@ -146,19 +266,7 @@ if settings.encryption_enabled:
 @app.get("/", tags=["Info"])
 async def root():
     """Root endpoint with API info."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "description": "ileterate - Multilingual Grammar Checking API",
-        "documentation": "/docs" if settings.debug else "Disabled in production",
-        "endpoints": {
-            "check": "/check",
-            "languages": "/languages",
-            "health": "/health",
-            "public_key": "/security/public-key"
-        },
-        "authentication": "API key required" if settings.api_key else "Disabled"
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/security/public-key", tags=["Security"])
@@ -167,7 +275,8 @@ async def get_public_key():
     Get the server's RSA public key for encryption.
 
     Returns the public key in PEM format that clients can use
-    to encrypt their requests.
+    to encrypt their requests, plus an X25519 public key for
+    clients using the 2.0-x25519 key agreement.
     """
     if not settings.encryption_enabled:
         raise HTTPException(
@@ -175,19 +284,13 @@ async def get_public_key():
             detail="Encryption not enabled"
         )
 
-    public_key = encryption_service.get_public_key_pem()
-    if not public_key:
+    if _PUBLIC_KEY_BYTES is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Encryption service not initialized"
         )
 
-    return {
-        "public_key": public_key,
-        "algorithm": "RSA-OAEP-SHA256",
-        "key_encryption": "AES-256-GCM",
-        "version": "1.0"
-    }
+    return Response(_PUBLIC_KEY_BYTES, media_type="application/json")
 
 
 @app.post(
@@ -217,7 +320,7 @@ The pipeline:
 )
 async def check_grammar(
     request: CheckRequest,
-    _api_key: str = Depends(api_key_middleware)
+    _api_key: str = Depends(_auth_dep)
 ) -> CheckResponse:
     """
     Check text for grammar issues and get corrections.
@@ -229,18 +332,10 @@ async def check_grammar(
         CheckResponse with corrections, issues, rewrites, and explanations
     """
     # Validate language
-    if request.language not in SUPPORTED_LANGUAGES:
+    if request.language not in _SUPPORTED_LANG_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported language: {request.language}. "
-                   f"Supported: {list(SUPPORTED_LANGUAGES.keys())}"
-        )
-
-    # Validate text length
-    if len(request.text) > settings.max_text_length:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Text too long. Maximum: {settings.max_text_length} characters"
+            detail=f"Unsupported language: {request.language}{_UNSUPPORTED_LANG_SUFFIX}"
         )
 
     try:
@@ -248,7 +343,7 @@ async def check_grammar(
         return result
 
     except Exception as e:
-        logger.error(f"Error processing request: {str(e)}")
+        logger.error("Error processing request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing request: {str(e)}"
@@ -262,18 +357,10 @@ async def check_grammar(
     summary="Get supported languages"
 )
 async def get_languages(
-    _api_key: str = Depends(api_key_middleware)
-) -> list[LanguageInfo]:
+    _api_key: str = Depends(_auth_dep)
+) -> Response:
     """Get list of supported languages with examples."""
-    languages = []
-    for code, config in SUPPORTED_LANGUAGES.items():
-        languages.append(LanguageInfo(
-            code=config["code"],
-            name=config["name"],
-            native_name=config["native_name"],
-            examples=config.get("examples", [])
-        ))
-    return languages
+    return Response(_LANGUAGES_BYTES, media_type="application/json")
 
 
 @app.get(
@@ -284,22 +371,18 @@ async def get_languages(
 )
 async def get_language(
     code: str,
-    _api_key: str = Depends(api_key_middleware)
-) -> LanguageInfo:
+    _api_key: str = Depends(_auth_dep)
+) -> Response:
     """Get information about a specific language."""
-    if code not in SUPPORTED_LANGUAGES:
+    try:
+        body = _LANGUAGE_BYTES_BY_CODE[code]
+    except KeyError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Language not found: {code}"
         )
 
-    config = SUPPORTED_LANGUAGES[code]
-    return LanguageInfo(
-        code=config["code"],
-        name=config["name"],
-        native_name=config["native_name"],
-        examples=config.get("examples", [])
-    )
+    return Response(body, media_type="application/json")
 
 
 @app.get(
@@ -314,13 +397,14 @@ async def health_check() -> HealthResponse:
 
     This endpoint does not require authentication.
     """
-    service_status = await pipeline.check_services()
+    service_status = await _health_cache.get()
 
-    return HealthResponse(
+    # Inputs are produced by our own probe, so skip model validation
+    return HealthResponse.model_construct(
         status="healthy" if service_status["languagetool"] else "degraded",
         languagetool_available=service_status["languagetool"],
         llm_available=service_status["llm"],
-        version=settings.app_version
+        version=_VERSION
     )
 
 
@@ -329,7 +413,7 @@ async def health_check() -> HealthResponse:
     tags=["System"],
     summary="Cache statistics"
 )
-async def cache_stats(_api_key: str = Depends(api_key_middleware)):
+async def cache_stats(_api_key: str = Depends(_auth_dep)):
     """Get cache statistics."""
     return get_cache().get_stats()
 
@@ -339,9 +423,10 @@ async def cache_stats(_api_key: str = Depends(api_key_middleware)):
     tags=["System"],
     summary="Clear cache"
 )
-async def clear_cache(_api_key: str = Depends(api_key_middleware)):
+async def clear_cache(_api_key: str = Depends(_auth_dep)):
     """Clear the grammar check cache."""
     get_cache().clear()
+    pipeline.clear_caches()
     return {"status": "cleared"}
 
 
@@ -351,8 +436,8 @@ async def clear_cache(_api_key: str = Depends(api_key_middleware)):
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"}
     )
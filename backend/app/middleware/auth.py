@@ -4,6 +4,8 @@ API Key Authentication Middleware.
 Provides API key validation for securing the grammar checking API.
 """
 
+import hashlib
+import re
 import secrets
 import logging
 from typing import Optional
@@ -21,6 +23,17 @@ API_KEY_HEADER = APIKeyHeader(
     description="API key for authentication. Required when API_KEY is configured."
 )
 
+# The configured key is read from the environment once and cannot change
+# during the process lifetime, so hash it at import. Comparing fixed-size
+# SHA-256 digests keeps the check constant-time and hides the key length.
+_api_key_setting = get_settings().api_key
+_API_KEY_HASH: Optional[bytes] = (
+    hashlib.sha256(_api_key_setting.encode()).digest() if _api_key_setting else None
+)
+
+# Minimum 32 characters, hex or base64url-like alphabet
+_API_KEY_RE = re.compile(r"\A[A-Za-z0-9_\-]{32,}\Z")
+
 
 def get_api_key_header():
     """Get the API key header security dependency."""
@@ -45,11 +58,10 @@ async def api_key_middleware(
     Raises:
         HTTPException: 401 if key is missing, 403 if key is invalid
     """
-    settings = get_settings()
-
     # If no API key is configured, authentication is disabled
-    if not settings.api_key:
-        logger.debug("API key authentication disabled (no key configured)")
+    if _API_KEY_HASH is None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API key authentication disabled (no key configured)")
         return None
 
     # API key is required but not provided
@@ -62,14 +74,16 @@ async def api_key_middleware(
         )
 
     # Validate the API key using constant-time comparison
-    if not secrets.compare_digest(api_key, settings.api_key):
+    incoming_hash = hashlib.sha256(api_key.encode()).digest()
+    if not secrets.compare_digest(incoming_hash, _API_KEY_HASH):
         logger.warning("Invalid API key attempted")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key",
         )
 
-    logger.debug("API key validated successfully")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("API key validated successfully")
     return api_key
 
 
@@ -96,12 +110,4 @@ def validate_api_key_format(key: str) -> bool:
     Returns:
         True if the key format is valid
     """
-    if not key:
-        return False
-
-    # Minimum 32 characters for security
-    if len(key) < 32:
-        return False
-
-    # Should be alphanumeric (hex or base64-like)
-    return key.isalnum() or all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_' for c in key)
+    return bool(key) and _API_KEY_RE.match(key) is not None
@@ -8,31 +8,107 @@ Provides RSA + AES hybrid encryption for secure request/response handling.
 """
 
 import base64
-import json
+import hashlib
 import logging
 import os
-from typing import Optional, Tuple
+import struct
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
 from dataclasses import dataclass
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import orjson
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 # Cryptography imports (optional dependency)
 try:
+    from cryptography.exceptions import UnsupportedAlgorithm
     from cryptography.hazmat.primitives import hashes, serialization
     from cryptography.hazmat.primitives.asymmetric import rsa, padding
-    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives.asymmetric.x25519 import (
+        X25519PrivateKey, X25519PublicKey
+    )
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
     from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.backends.openssl.backend import backend as openssl_backend
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
     logger.warning("cryptography package not installed. Encryption features disabled.")
 
+# SIMD base64 codec (optional dependency, falls back to the stdlib)
+try:
+    import pybase64
+    _b64decode = pybase64.b64decode
+    _b64encode_str = pybase64.b64encode_as_string
+except ImportError:
+    _b64decode = base64.b64decode
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode('utf-8')
+
+# Session key size in bytes. AES-128 runs 10 rounds against AES-256's 14;
+# payloads encrypted with either size still decrypt (format "1.0" is 256-bit)
+AES_KEY_SIZE = 16
+PAYLOAD_VERSION = "1.1"
+
+# ChaCha20-Poly1305 replaces AES-GCM on CPUs without AES instructions,
+# where software AES is several times slower
+CHACHA_KEY_SIZE = 32
+CHACHA_PAYLOAD_VERSION = "1.0-chacha"
+
+# X25519 key agreement replaces RSA-OAEP key transport for new clients: the
+# payload's encrypted_key carries the client's ephemeral X25519 public key and
+# the AES-256-GCM key is derived with HKDF-SHA256 from the shared secret
+X25519_PAYLOAD_VERSION = "2.0-x25519"
+_X25519_HKDF_INFO = b"e2e-aead"
+
+# Maximum number of unwrapped session keys kept in memory
+SESSION_KEY_CACHE_SIZE = 1024
+
+# Binary framing avoids the base64 + JSON envelope of the 1.0 format:
+# [iv length: u16][key length: u16][iv][encrypted key][ciphertext || tag]
+# Frames carry no version and use the cipher the server advertises.
+BINARY_CONTENT_TYPE = "application/x-encrypted-binary"
+_FRAME_HEADER = struct.Struct("!HH")
+
+# OpenSSL 3.0 ships the AVX2/AVX-512 IFMA RSAZ modular exponentiation that
+# dominates RSA-OAEP decryption cost
+_MIN_FAST_RSA_OPENSSL = 0x30000000
+
+
+def _check_openssl_backend() -> None:
+    """Log the linked OpenSSL and warn when the fast RSA paths may be off."""
+    logger.info("Encryption backend: %s", openssl_backend.openssl_version_text())
+    if openssl_backend.openssl_version_number() < _MIN_FAST_RSA_OPENSSL:
+        logger.warning(
+            "cryptography is linked against OpenSSL < 3.0; "
+            "RSA decryption will not use the AVX-512 RSAZ fast path"
+        )
+    if os.environ.get("OPENSSL_ia32cap"):
+        logger.warning(
+            "OPENSSL_ia32cap is set; CPU-specific RSA/AES code paths may be disabled"
+        )
 
-@dataclass
+
+def _has_aes_hardware() -> bool:
+    """Check /proc/cpuinfo for AES instructions (AES-NI or ARMv8 AES)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    return "aes" in line.split()
+    except OSError:
+        pass
+    # Unknown platform; assume hardware AES
+    return True
+
+
+@dataclass(slots=True)
 class EncryptedPayload:
     """Structure for encrypted request/response payloads."""
     encrypted_key: str  # Base64 encoded RSA-encrypted AES key
@@ -56,19 +132,34 @@ class EncryptionService:
     def __init__(self):
         self._private_key = None
         self._public_key = None
+        self._public_pem: Optional[str] = None
         self._initialized = False
+        self._use_chacha = False
+        self._x25519_key = None
+        self._x25519_public: Optional[str] = None
+        # Padding parameters are immutable; build them once, not per request
+        self._oaep = padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        ) if CRYPTO_AVAILABLE else None
+        # Unwrapped session keys by RSA ciphertext digest; clients reusing an
+        # encrypted session key skip the RSA-OAEP decryption entirely
+        self._session_keys: "OrderedDict[bytes, bytes]" = OrderedDict()
 
     def initialize(
         self,
         private_key_path: Optional[str] = None,
-        public_key_path: Optional[str] = None
+        public_key_path: Optional[str] = None,
+        x25519_private_key_path: Optional[str] = None
     ) -> bool:
         """
-        Initialize encryption service with RSA keys.
+        Initialize encryption service with RSA and X25519 keys.
 
         Args:
             private_key_path: Path to PEM-encoded private key
             public_key_path: Path to PEM-encoded public key
+            x25519_private_key_path: Path to PEM-encoded X25519 private key
 
         Returns:
             True if initialization successful
@@ -86,7 +177,7 @@ class EncryptionService:
                         password=None,
                         backend=default_backend()
                     )
-                logger.info(f"Loaded RSA private key from {private_key_path}")
+                logger.info("Loaded RSA private key from %s", private_key_path)
 
             # Load public key if path provided
             if public_key_path and os.path.exists(public_key_path):
@@ -95,34 +186,188 @@ class EncryptionService:
                         f.read(),
                         backend=default_backend()
                     )
-                logger.info(f"Loaded RSA public key from {public_key_path}")
+                logger.info("Loaded RSA public key from %s", public_key_path)
 
             # Derive public key from private if not provided
             if self._private_key and not self._public_key:
                 self._public_key = self._private_key.public_key()
 
+            # The public key never changes, so serialize it once
+            if self._public_key:
+                self._public_pem = self._public_key.public_bytes(
+                    encoding=serialization.Encoding.PEM,
+                    format=serialization.PublicFormat.SubjectPublicKeyInfo
+                ).decode('utf-8')
+
+            # X25519 key agreement is only enabled with a key file: a key
+            # generated per process would differ between workers
+            if x25519_private_key_path:
+                self._x25519_key = self._load_x25519_key(x25519_private_key_path)
+            else:
+                self._x25519_key = None
+                logger.info("No X25519 key configured; X25519 key agreement disabled")
+            if self._x25519_key is not None:
+                self._x25519_public = _b64encode_str(
+                    self._x25519_key.public_key().public_bytes(
+                        encoding=serialization.Encoding.Raw,
+                        format=serialization.PublicFormat.Raw
+                    )
+                )
+
+            _check_openssl_backend()
+            self._use_chacha = not _has_aes_hardware()
+            if self._use_chacha:
+                logger.info("No AES hardware detected, using ChaCha20-Poly1305")
+
             self._initialized = self._private_key is not None
             return self._initialized
 
         except Exception as e:
-            logger.error(f"Failed to initialize encryption: {e}")
+            logger.error("Failed to initialize encryption: %s", e)
             return False
 
+    def _load_x25519_key(self, path: str) -> Optional["X25519PrivateKey"]:
+        """
+        Load the X25519 private key from a PEM file.
+
+        Returns None, disabling X25519 key agreement, if the configured file
+        is missing, cannot be parsed or holds another kind of key; RSA
+        encryption is unaffected.
+        """
+        if not os.path.exists(path):
+            logger.error("X25519 key file %s not found; X25519 key agreement disabled", path)
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                key = serialization.load_pem_private_key(f.read(), password=None)
+        except (ValueError, TypeError, UnsupportedAlgorithm) as e:
+            logger.error(
+                "Cannot load X25519 key from %s (%s); X25519 key agreement disabled",
+                path, e
+            )
+            return None
+        if not isinstance(key, X25519PrivateKey):
+            logger.error("%s is not an X25519 private key; X25519 key agreement disabled", path)
+            return None
+
+        logger.info("Loaded X25519 private key from %s", path)
+        return key
+
     @property
     def is_available(self) -> bool:
         """Check if encryption service is available."""
         return CRYPTO_AVAILABLE and self._initialized
 
+    @property
+    def payload_version(self) -> str:
+        """Payload version produced by this server."""
+        return CHACHA_PAYLOAD_VERSION if self._use_chacha else PAYLOAD_VERSION
+
+    @property
+    def key_encryption(self) -> str:
+        """Symmetric cipher used for payloads, as advertised to clients."""
+        return "ChaCha20-Poly1305" if self._use_chacha else "AES-128-GCM"
+
     def get_public_key_pem(self) -> Optional[str]:
         """Get the public key in PEM format for clients."""
+        return self._public_pem
+
+    def get_x25519_public_key(self) -> Optional[str]:
+        """Get the raw X25519 public key, base64 encoded, for clients."""
+        return self._x25519_public
+
+    def _unwrap_session_key(self, encrypted_key: bytes, x25519: bool = False) -> bytes:
+        """
+        Recover the AES key for a payload, reusing previously unwrapped keys.
+
+        RSA-OAEP decryption and X25519 + HKDF derivation are both
+        deterministic for given key material, so caching by its digest
+        returns exactly what the asymmetric step would.
+        """
+        digest = hashlib.blake2b(encrypted_key, digest_size=16).digest()
+
+        aes_key = self._session_keys.get(digest)
+        if aes_key is not None:
+            self._session_keys.move_to_end(digest)
+            return aes_key
+
+        if x25519:
+            if self._x25519_key is None:
+                raise ValueError("X25519 key agreement not enabled")
+            shared = self._x25519_key.exchange(
+                X25519PublicKey.from_public_bytes(encrypted_key)
+            )
+            aes_key = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=_X25519_HKDF_INFO
+            ).derive(shared)
+        else:
+            aes_key = self._private_key.decrypt(encrypted_key, self._oaep)
+        self._session_keys[digest] = aes_key
+        if len(self._session_keys) > SESSION_KEY_CACHE_SIZE:
+            self._session_keys.popitem(last=False)
+        return aes_key
+
+    def _decrypt(
+        self,
+        encrypted_key: bytes,
+        encrypted_data: bytes,
+        iv: bytes,
+        chacha: bool = False,
+        x25519: bool = False
+    ) -> dict:
+        """Decrypt raw hybrid-encrypted components into JSON data."""
+        if not self._private_key:
+            raise ValueError("Private key not loaded")
+
+        try:
+            # Recover the AES key with RSA or X25519 (cached per session key)
+            aes_key = self._unwrap_session_key(encrypted_key, x25519=x25519)
+
+            # Decrypt the data (tag is appended to ciphertext); for AES-GCM
+            # the key size selects AES-128 or AES-256
+            aead = ChaCha20Poly1305(aes_key) if chacha else AESGCM(aes_key)
+            decrypted = aead.decrypt(iv, encrypted_data, None)
+
+            return orjson.loads(decrypted)
+
+        except Exception as e:
+            logger.error("Decryption failed: %s", e)
+            raise ValueError(f"Failed to decrypt payload: {e}")
+
+    def _encrypt(self, data: Union[dict, bytes]) -> Tuple[bytes, bytes, bytes]:
+        """Encrypt JSON data, returning (encrypted_key, encrypted_data, iv)."""
         if not self._public_key:
-            return None
+            raise ValueError("Public key not loaded")
 
-        pem = self._public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode('utf-8')
+        try:
+            # Generate random session key and IV
+            iv = os.urandom(12)  # 96-bit nonce for GCM and ChaCha20
+            if self._use_chacha:
+                aes_key = os.urandom(CHACHA_KEY_SIZE)
+                aead = ChaCha20Poly1305(aes_key)
+            else:
+                aes_key = os.urandom(AES_KEY_SIZE)  # 128-bit key
+                aead = AESGCM(aes_key)
+
+            # Encrypt data; the 16-byte tag is appended
+            plaintext = data if isinstance(data, bytes) else orjson.dumps(data)
+            encrypted_data = aead.encrypt(iv, plaintext, None)
+
+            # Encrypt AES key with RSA
+            encrypted_key = self._public_key.encrypt(
+                aes_key,
+                self._oaep
+            )
+
+            return encrypted_key, encrypted_data, iv
+
+        except Exception as e:
+            logger.error("Encryption failed: %s", e)
+            raise ValueError(f"Failed to encrypt payload: {e}")
 
     def decrypt_payload(self, encrypted: EncryptedPayload) -> dict:
         """
@@ -137,62 +382,28 @@ class EncryptionService:
         Raises:
             ValueError: If decryption fails
         """
-        if not self._private_key:
-            raise ValueError("Private key not loaded")
-
         try:
             # Decode base64 components
-            encrypted_key = base64.b64decode(encrypted.encrypted_key)
-            encrypted_data = base64.b64decode(encrypted.encrypted_data)
-            iv = base64.b64decode(encrypted.iv)
-
-            # Decrypt the AES key with RSA
-            aes_key = self._private_key.decrypt(
-                encrypted_key,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
-            )
-
-            # Decrypt the data with AES
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.GCM(iv),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-
-            # GCM tag is appended to ciphertext
-            tag_length = 16
-            ciphertext = encrypted_data[:-tag_length]
-            tag = encrypted_data[-tag_length:]
-
-            decryptor = cipher.decryptor()
-            decryptor.authenticate_additional_data(b"")
-
-            # For GCM, we need to handle the tag separately
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.GCM(iv, tag),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            decrypted = decryptor.update(ciphertext) + decryptor.finalize()
-
-            return json.loads(decrypted.decode('utf-8'))
-
+            encrypted_key = _b64decode(encrypted.encrypted_key)
+            encrypted_data = _b64decode(encrypted.encrypted_data)
+            iv = _b64decode(encrypted.iv)
         except Exception as e:
-            logger.error(f"Decryption failed: {e}")
             raise ValueError(f"Failed to decrypt payload: {e}")
 
-    def encrypt_payload(self, data: dict) -> EncryptedPayload:
+        return self._decrypt(
+            encrypted_key,
+            encrypted_data,
+            iv,
+            chacha=encrypted.version == CHACHA_PAYLOAD_VERSION,
+            x25519=encrypted.version == X25519_PAYLOAD_VERSION
+        )
+
+    def encrypt_payload(self, data: Union[dict, bytes]) -> EncryptedPayload:
         """
         Encrypt a response payload for the client.
 
         Args:
-            data: Dictionary to encrypt
+            data: Dictionary to encrypt, or already serialized JSON bytes
 
         Returns:
             EncryptedPayload with encrypted data
@@ -200,48 +411,66 @@ class EncryptionService:
         Raises:
             ValueError: If encryption fails
         """
-        if not self._public_key:
-            raise ValueError("Public key not loaded")
+        encrypted_key, encrypted_data, iv = self._encrypt(data)
 
-        try:
-            # Generate random AES key and IV
-            aes_key = os.urandom(32)  # 256-bit key
-            iv = os.urandom(12)  # 96-bit IV for GCM
-
-            # Encrypt data with AES-GCM
-            cipher = Cipher(
-                algorithms.AES(aes_key),
-                modes.GCM(iv),
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
+        return EncryptedPayload(
+            encrypted_key=_b64encode_str(encrypted_key),
+            encrypted_data=_b64encode_str(encrypted_data),
+            iv=_b64encode_str(iv),
+            version=self.payload_version
+        )
 
-            plaintext = json.dumps(data).encode('utf-8')
-            ciphertext = encryptor.update(plaintext) + encryptor.finalize()
+    def decrypt_frame(self, frame: bytes) -> dict:
+        """
+        Decrypt a binary-framed payload from the client.
 
-            # Append GCM tag to ciphertext
-            encrypted_data = ciphertext + encryptor.tag
+        Args:
+            frame: Length-prefixed iv, encrypted key and ciphertext
 
-            # Encrypt AES key with RSA
-            encrypted_key = self._public_key.encrypt(
-                aes_key,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
-            )
+        Returns:
+            Decrypted JSON data as dictionary
 
-            return EncryptedPayload(
-                encrypted_key=base64.b64encode(encrypted_key).decode('utf-8'),
-                encrypted_data=base64.b64encode(encrypted_data).decode('utf-8'),
-                iv=base64.b64encode(iv).decode('utf-8'),
-                version="1.0"
-            )
+        Raises:
+            ValueError: If the frame is malformed or decryption fails
+        """
+        try:
+            iv_len, key_len = _FRAME_HEADER.unpack_from(frame)
+        except struct.error as e:
+            raise ValueError(f"Malformed encrypted frame: {e}")
+
+        key_start = _FRAME_HEADER.size + iv_len
+        data_start = key_start + key_len
+        if data_start > len(frame):
+            raise ValueError("Malformed encrypted frame: truncated")
+
+        view = memoryview(frame)
+        return self._decrypt(
+            bytes(view[key_start:data_start]),
+            bytes(view[data_start:]),
+            bytes(view[_FRAME_HEADER.size:key_start]),
+            chacha=self._use_chacha
+        )
 
-        except Exception as e:
-            logger.error(f"Encryption failed: {e}")
-            raise ValueError(f"Failed to encrypt payload: {e}")
+    def encrypt_frame(self, data: Union[dict, bytes]) -> bytes:
+        """
+        Encrypt a response payload into a binary frame for the client.
+
+        Args:
+            data: Dictionary to encrypt, or already serialized JSON bytes
+
+        Returns:
+            Length-prefixed iv, encrypted key and ciphertext
+
+        Raises:
+            ValueError: If encryption fails
+        """
+        encrypted_key, encrypted_data, iv = self._encrypt(data)
+        return b"".join((
+            _FRAME_HEADER.pack(len(iv), len(encrypted_key)),
+            iv,
+            encrypted_key,
+            encrypted_data
+        ))
 
     @staticmethod
     def generate_key_pair(key_size: int = 2048) -> Tuple[bytes, bytes]:
@@ -281,76 +510,138 @@ class EncryptionService:
 encryption_service = EncryptionService()
 
 
-class EncryptionMiddleware(BaseHTTPMiddleware):
+class EncryptionMiddleware:
     """
-    FastAPI middleware for handling encrypted requests/responses.
+    ASGI middleware for handling encrypted requests/responses.
 
     When encryption is enabled:
     - POST requests with Content-Type: application/x-encrypted are decrypted
     - Responses are encrypted if Accept: application/x-encrypted is set
+    - application/x-encrypted-binary selects binary framing instead of the
+      base64 JSON envelope, for both requests and responses
+
+    Responses are intercepted at the ASGI send level, so the JSON body the
+    endpoint already serialized is encrypted as-is without being parsed and
+    re-serialized.
     """
 
-    def __init__(self, app, encryption_svc: EncryptionService = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, encryption_svc: EncryptionService = None):
+        self.app = app
         self.encryption = encryption_svc or encryption_service
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request, handling encryption if needed."""
-        # Check if this is an encrypted request
-        content_type = request.headers.get("content-type", "")
-        is_encrypted_request = "application/x-encrypted" in content_type
+        # Keys are loaded during lifespan startup, after the middleware stack
+        # is built, so availability is checked per request rather than here
+        if scope["type"] != "http" or not self.encryption.is_available:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+
+        # Check if this is an encrypted request; Content-Type is a single
+        # media type, so a prefix check suffices
+        content_type = headers.get("content-type", "")
+        if content_type.startswith("application/x-encrypted"):
+            messages = []
+            chunks = []
+            more_body = True
+            while more_body:
+                message = await receive()
+                messages.append(message)
+                chunks.append(message.get("body", b""))
+                more_body = message.get("more_body", False)
+            body = b"".join(chunks)
 
-        if is_encrypted_request and self.encryption.is_available:
             try:
-                # Read and decrypt the request body
-                body = await request.body()
-                encrypted_data = json.loads(body)
-                encrypted_payload = EncryptedPayload(**encrypted_data)
-
-                # Decrypt and replace request body
-                decrypted_data = self.encryption.decrypt_payload(encrypted_payload)
+                # Decrypt the request body
+                if content_type.startswith(BINARY_CONTENT_TYPE):
+                    decrypted_data = self.encryption.decrypt_frame(body)
+                else:
+                    decoded = orjson.loads(body)
+                    encrypted_payload = EncryptedPayload(
+                        decoded["encrypted_key"],
+                        decoded["encrypted_data"],
+                        decoded["iv"],
+                        decoded.get("version", "1.0")
+                    )
+                    decrypted_data = self.encryption.decrypt_payload(encrypted_payload)
 
-                # Create new request with decrypted body
                 # Store decrypted data in request state
-                request.state.decrypted_body = decrypted_data
+                scope.setdefault("state", {})["decrypted_body"] = decrypted_data
 
             except Exception as e:
-                logger.error(f"Failed to decrypt request: {e}")
-                return JSONResponse(
+                logger.error("Failed to decrypt request: %s", e)
+                response = JSONResponse(
                     status_code=400,
                     content={"detail": "Failed to decrypt request"}
                 )
+                await response(scope, receive, send)
+                return
 
-        # Process the request
-        response = await call_next(request)
+            # Replay the consumed body to the application
+            async def replay_receive() -> Message:
+                return messages.pop(0) if messages else await receive()
 
-        # Check if client wants encrypted response
-        accept = request.headers.get("accept", "")
-        wants_encrypted = "application/x-encrypted" in accept
+            receive = replay_receive
 
-        if wants_encrypted and self.encryption.is_available:
+        # Check if client wants encrypted response
+        accept = headers.get("accept", "")
+        if "application/x-encrypted" not in accept:
+            await self.app(scope, receive, send)
+            return
+
+        binary = BINARY_CONTENT_TYPE in accept
+        start_message: Optional[Message] = None
+        body_chunks = []
+
+        async def send_encrypted(message: Message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                # Hold the start until the body is known; only JSON is encrypted
+                response_type = Headers(raw=message["headers"]).get("content-type", "")
+                if response_type.startswith("application/json"):
+                    start_message = message
+                else:
+                    await send(message)
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_chunks)
             try:
-                # Read response body
-                body = b""
-                async for chunk in response.body_iterator:
-                    body += chunk
-
-                # Encrypt response
-                response_data = json.loads(body)
-                encrypted = self.encryption.encrypt_payload(response_data)
-
-                return JSONResponse(
-                    content={
-                        "encrypted_key": encrypted.encrypted_key,
-                        "encrypted_data": encrypted.encrypted_data,
-                        "iv": encrypted.iv,
-                        "version": encrypted.version
-                    },
-                    headers={"Content-Type": "application/x-encrypted+json"}
-                )
-
+                if binary:
+                    response = Response(
+                        content=self.encryption.encrypt_frame(body),
+                        status_code=start_message["status"],
+                        media_type=BINARY_CONTENT_TYPE
+                    )
+                else:
+                    encrypted = self.encryption.encrypt_payload(body)
+                    response = Response(
+                        content=orjson.dumps({
+                            "encrypted_key": encrypted.encrypted_key,
+                            "encrypted_data": encrypted.encrypted_data,
+                            "iv": encrypted.iv,
+                            "version": encrypted.version
+                        }),
+                        status_code=start_message["status"],
+                        media_type="application/x-encrypted+json"
+                    )
             except Exception as e:
-                logger.error(f"Failed to encrypt response: {e}")
+                logger.error("Failed to encrypt response: %s", e)
                 # Return original response on encryption failure
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            await response(scope, receive, send)
 
-        return response
+        await self.app(scope, receive, send_encrypted)
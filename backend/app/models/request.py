@@ -1,9 +1,14 @@
 """Request models for the Grammar Checking API."""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional
 from enum import Enum
 
+from ..config import get_settings
+
+# Enforced by pydantic-core while parsing, before any handler code runs
+_MAX_TEXT_LENGTH = get_settings().max_text_length
+
 
 class CheckMode(str, Enum):
     """Grammar checking mode."""
@@ -31,14 +36,18 @@ class CheckRequest(BaseModel):
         include_explanations: Whether to include detailed explanations
     """
 
-    text: str = Field(
+    # Whitespace stripping runs inside pydantic-core
+    text: Annotated[str, StringConstraints(strip_whitespace=True)] = Field(
         ...,
         min_length=1,
-        max_length=10000,
+        max_length=_MAX_TEXT_LENGTH,
         description="Text to check for grammar issues"
     )
 
-    language: str = Field(
+    # Lowercasing also runs inside pydantic-core
+    language: Annotated[
+        str, StringConstraints(strip_whitespace=True, to_lower=True)
+    ] = Field(
         default="nl",
         min_length=2,
         max_length=5,
@@ -60,18 +69,6 @@ class CheckRequest(BaseModel):
         description="Include detailed explanations for each correction"
     )
 
-    @field_validator("language")
-    @classmethod
-    def validate_language(cls, v: str) -> str:
-        """Normalize language code to lowercase."""
-        return v.lower().strip()
-
-    @field_validator("text")
-    @classmethod
-    def validate_text(cls, v: str) -> str:
-        """Strip leading/trailing whitespace from text."""
-        return v.strip()
-
     model_config = {
         "json_schema_extra": {
             "examples": [
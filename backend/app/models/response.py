@@ -1,6 +1,6 @@
 """Response models for the Grammar Checking API."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from typing import List, Optional
 from enum import Enum
 
@@ -145,11 +145,12 @@ class CheckResponse(BaseModel):
         description="Whether rule-based fallback was used"
     )
     language: str = Field(..., description="Language code used for checking")
-    issue_count: int = Field(default=0, description="Total number of issues found")
 
-    def model_post_init(self, __context) -> None:
-        """Calculate issue count after initialization."""
-        object.__setattr__(self, 'issue_count', len(self.issues))
+    @computed_field(description="Total number of issues found")
+    @property
+    def issue_count(self) -> int:
+        """Number of issues, derived when the response is serialized."""
+        return len(self.issues)
 
 
 class LanguageInfo(BaseModel):
@@ -9,73 +9,50 @@ These prompts are designed to:
 """
 
 import json
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from ..config import SUPPORTED_LANGUAGES, TONE_DESCRIPTIONS
 from ..models.request import Tone
 from ..models.response import GrammarIssue
 
 
-def get_language_name(language_code: str) -> str:
-    """Get the full language name for a code."""
-    lang_config = SUPPORTED_LANGUAGES.get(language_code, {})
-    return lang_config.get("name", language_code.upper())
+# Placeholder for per-request values; the static template parts around it
+# are rendered once per (language, tone, ...) and cached
+_SLOT = "\x00"
 
 
-def format_issues_for_prompt(issues: List[GrammarIssue]) -> str:
-    """Format grammar issues as a structured list for the prompt."""
-    formatted = []
-    for i, issue in enumerate(issues, 1):
-        suggestions_str = ", ".join(f'"{s}"' for s in issue.suggestions[:3])
-        formatted.append(
-            f"{i}. Position {issue.offset}-{issue.offset + issue.length}: "
-            f'"{issue.original_text}" → Suggestions: [{suggestions_str}] '
-            f"| Rule: {issue.rule_id} | Issue: {issue.message}"
-        )
-    return "\n".join(formatted)
+@lru_cache(maxsize=16)
+def get_language_name(language_code: str) -> str:
+    """Get the full language name for a code."""
+    lang_config = SUPPORTED_LANGUAGES.get(language_code)
+    return lang_config.name if lang_config else language_code.upper()
 
 
-def build_grammar_prompt(
-    text: str,
-    issues: List[GrammarIssue],
-    language: str = "nl",
-    tone: Tone = Tone.NEUTRAL,
-    include_rewrites: bool = True
-) -> str:
-    """
-    Build a language-aware prompt for grammar correction.
+def _quote_suggestions(suggestions: List[str]) -> str:
+    """Quote and comma-separate the top three suggestions in a single join."""
+    if not suggestions:
+        return ""
+    return '"' + '", "'.join(suggestions[:3]) + '"'
 
-    Args:
-        text: Original text with issues
-        issues: Detected grammar issues from LanguageTool
-        language: ISO language code
-        tone: Desired tone for rewrites
-        include_rewrites: Whether to request rewrite suggestions
 
-    Returns:
-        Complete prompt string for the LLM
-    """
-    language_name = get_language_name(language)
-    tone_description = TONE_DESCRIPTIONS.get(tone.value, TONE_DESCRIPTIONS["neutral"])
-    issues_formatted = format_issues_for_prompt(issues)
+def format_issues_for_prompt(issues: List[GrammarIssue]) -> str:
+    """Format grammar issues as a structured list for the prompt."""
+    return "\n".join(
+        f"{i}. Position {issue.offset}-{issue.offset + issue.length}: "
+        f'"{issue.original_text}" → Suggestions: [{_quote_suggestions(issue.suggestions)}] '
+        f"| Rule: {issue.rule_id} | Issue: {issue.message}"
+        for i, issue in enumerate(issues, 1)
+    )
 
-    # Build the rewrite instruction if needed
-    rewrite_instruction = ""
-    if include_rewrites:
-        rewrite_instruction = f"""
-Additionally, provide 2 alternative rewrites:
-1. FIRST rewrite MUST be in "{tone.value}" tone ({tone_description}) - this is the user's selected tone
-2. SECOND rewrite can be in a contrasting tone for comparison
-Each rewrite should preserve the original meaning while improving clarity or style.
-"""
 
-    prompt = f"""You are a precise grammar correction assistant for {language_name}.
+_GRAMMAR_PROMPT = """You are a precise grammar correction assistant for {language_name}.
 
 ORIGINAL TEXT:
 "{text}"
 
 DETECTED ISSUES (from LanguageTool - treat as ground truth):
-{issues_formatted}
+{issues}
 
 YOUR TASK:
 1. Create a corrected version by applying ONLY the fixes for the detected issues above
@@ -111,14 +88,71 @@ OUTPUT FORMAT (strict JSON):
 }}
 
 IMPORTANT:
-- The "corrected_text" must contain ONLY fixes for the {len(issues)} detected issues
+- The "corrected_text" must contain ONLY fixes for the {issue_count} detected issues
 - Explanations should be in {language_name} language
 - If no rewrites requested, return empty array for rewrites
 - Score should reflect how natural and well-written the rewrite is (0-10)
 
 Respond with JSON only, no additional text."""
 
-    return prompt
+
+@lru_cache(maxsize=64)
+def _grammar_prompt_parts(
+    language: str,
+    tone: Tone,
+    include_rewrites: bool
+) -> Tuple[str, ...]:
+    """
+    Render the fixed parts of the grammar prompt once per configuration.
+
+    Returns the four segments surrounding the text, the formatted issues
+    and the issue count.
+    """
+    language_name = get_language_name(language)
+    tone_description = TONE_DESCRIPTIONS.get(tone.value, TONE_DESCRIPTIONS["neutral"])
+
+    # Build the rewrite instruction if needed
+    rewrite_instruction = ""
+    if include_rewrites:
+        rewrite_instruction = f"""
+Additionally, provide 2 alternative rewrites:
+1. FIRST rewrite MUST be in "{tone.value}" tone ({tone_description}) - this is the user's selected tone
+2. SECOND rewrite can be in a contrasting tone for comparison
+Each rewrite should preserve the original meaning while improving clarity or style.
+"""
+
+    return tuple(_GRAMMAR_PROMPT.format(
+        language_name=language_name,
+        rewrite_instruction=rewrite_instruction,
+        text=_SLOT,
+        issues=_SLOT,
+        issue_count=_SLOT
+    ).split(_SLOT))
+
+
+def build_grammar_prompt(
+    text: str,
+    issues: List[GrammarIssue],
+    language: str = "nl",
+    tone: Tone = Tone.NEUTRAL,
+    include_rewrites: bool = True
+) -> str:
+    """
+    Build a language-aware prompt for grammar correction.
+
+    Args:
+        text: Original text with issues
+        issues: Detected grammar issues from LanguageTool
+        language: ISO language code
+        tone: Desired tone for rewrites
+        include_rewrites: Whether to request rewrite suggestions
+
+    Returns:
+        Complete prompt string for the LLM
+    """
+    issues_formatted = format_issues_for_prompt(issues)
+    head, middle, body, tail = _grammar_prompt_parts(language, tone, include_rewrites)
+    return "".join((head, text, middle, issues_formatted, body, str(len(issues)), tail))
 
 
 # Language-specific system prompts for additional context
@@ -160,6 +194,7 @@ LANGUAGE_SYSTEM_PROMPTS = {
 }
 
 
+@lru_cache(maxsize=16)
 def get_system_prompt(language: str) -> str:
     """Get language-specific system prompt."""
     return LANGUAGE_SYSTEM_PROMPTS.get(
@@ -168,31 +203,7 @@ def get_system_prompt(language: str) -> str:
     )
 
 
-def build_style_rewrite_prompt(
-    text: str,
-    language: str = "nl",
-    tone: Tone = Tone.NEUTRAL
-) -> str:
-    """
-    Build a prompt for style analysis and rewriting.
-
-    Used when LanguageTool found no issues, but we still want:
-    1. LLM to check for potential issues LanguageTool might have missed
-    2. Style improvement suggestions
-    3. Alternative rewrites with different tones
-
-    Args:
-        text: Text to analyze
-        language: ISO language code
-        tone: Desired tone for rewrites
-
-    Returns:
-        Complete prompt string for the LLM
-    """
-    language_name = get_language_name(language)
-    tone_description = TONE_DESCRIPTIONS.get(tone.value, TONE_DESCRIPTIONS["neutral"])
-
-    prompt = f"""You are an expert {language_name} language assistant and editor.
+_STYLE_PROMPT = """You are an expert {language_name} language assistant and editor.
 
 ORIGINAL TEXT:
 "{text}"
@@ -208,7 +219,7 @@ A grammar checker found no issues in this text. However, you should:
    - For Dutch: de/het errors, verb conjugation, word order
 
 2. GENERATE 2 rewrite suggestions:
-   - FIRST rewrite MUST be in "{tone.value}" tone ({tone_description}) - this is the user's selected tone
+   - FIRST rewrite MUST be in "{tone}" tone ({tone_description}) - this is the user's selected tone
    - SECOND rewrite can be in a contrasting tone for comparison
    - Each should improve clarity or readability
 
@@ -248,4 +259,38 @@ NOTES:
 
 Respond with JSON only, no additional text."""
 
-    return prompt
+
+@lru_cache(maxsize=64)
+def _style_prompt_parts(language: str, tone: Tone) -> Tuple[str, ...]:
+    """Render the style prompt around the text slot once per configuration."""
+    return tuple(_STYLE_PROMPT.format(
+        language_name=get_language_name(language),
+        tone=tone.value,
+        tone_description=TONE_DESCRIPTIONS.get(tone.value, TONE_DESCRIPTIONS["neutral"]),
+        text=_SLOT
+    ).split(_SLOT))
+
+
+def build_style_rewrite_prompt(
+    text: str,
+    language: str = "nl",
+    tone: Tone = Tone.NEUTRAL
+) -> str:
+    """
+    Build a prompt for style analysis and rewriting.
+
+    Used when LanguageTool found no issues, but we still want:
+    1. LLM to check for potential issues LanguageTool might have missed
+    2. Style improvement suggestions
+    3. Alternative rewrites with different tones
+
+    Args:
+        text: Text to analyze
+        language: ISO language code
+        tone: Desired tone for rewrites
+
+    Returns:
+        Complete prompt string for the LLM
+    """
+    head, tail = _style_prompt_parts(language, tone)
+    return "".join((head, text, tail))
@@ -2,12 +2,13 @@
 
 from .languagetool import LanguageToolService
 from .llm import LLMService
-from .pipeline import GrammarPipeline
+from .pipeline import GrammarPipeline, get_pipeline
 from .validator import ValidationService
 
 __all__ = [
     "LanguageToolService",
     "LLMService",
     "GrammarPipeline",
+    "get_pipeline",
     "ValidationService"
 ]
@@ -5,15 +5,70 @@ Handles communication with the local LanguageTool HTTP API for rule-based
 grammar detection. This is Stage 1 of the two-stage pipeline.
 """
 
+import asyncio
+import hashlib
+import sys
 import httpx
-from typing import List, Optional
+import orjson
+from cachetools import LRUCache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 import logging
 
 from ..config import get_settings, SUPPORTED_LANGUAGES
 from ..models.response import GrammarIssue, IssueSeverity, IssueCategory
+from ..utils.chunker import TextChunker
 
 logger = logging.getLogger(__name__)
 
+# Number of (language, text) check results kept; LanguageTool output is
+# deterministic, so resubmitted text skips the HTTP round-trip
+RESULT_CACHE_SIZE = 1024
+
+# Shared defaults for missing match fields, so lookups on a miss do not
+# allocate a fresh {} / [] per match
+_EMPTY: Mapping = MappingProxyType({})
+_NO_REPLACEMENTS: tuple = ()
+
+# Connection pool shared by all LanguageTool calls (keep-alive across requests)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+# Internal language code to LanguageTool code, flattened once at import
+_LANGUAGETOOL_CODES = {
+    code: config.languagetool_code for code, config in SUPPORTED_LANGUAGES.items()
+}
+
+# LanguageTool category ids (uppercase) to internal categories
+_CATEGORY_MAP = {
+    "GRAMMAR": IssueCategory.GRAMMAR,
+    "TYPOS": IssueCategory.SPELLING,
+    "SPELLING": IssueCategory.SPELLING,
+    "PUNCTUATION": IssueCategory.PUNCTUATION,
+    "STYLE": IssueCategory.STYLE,
+    "TYPOGRAPHY": IssueCategory.TYPOGRAPHY,
+    "CASING": IssueCategory.TYPOGRAPHY,
+    "CONFUSED_WORDS": IssueCategory.GRAMMAR,
+    "REDUNDANCY": IssueCategory.STYLE,
+    "MISC": IssueCategory.OTHER,
+    "OTHER": IssueCategory.OTHER,
+}
+
+# LanguageTool issue types (lowercase) to severities
+_SEVERITY_MAP = {
+    "misspelling": IssueSeverity.ERROR,
+    "grammar": IssueSeverity.ERROR,
+    "style": IssueSeverity.STYLE,
+    "typographical": IssueSeverity.WARNING,
+    "hint": IssueSeverity.HINT,
+    "other": IssueSeverity.WARNING,
+}
+
+# Both maps also hold the other casing, so the usual lookup hits without
+# case conversion; the conversion is only done on a miss
+_CATEGORY_MAP.update({k.lower(): v for k, v in _CATEGORY_MAP.items()})
+_SEVERITY_MAP.update({k.upper(): v for k, v in _SEVERITY_MAP.items()})
+
 
 class LanguageToolError(Exception):
     """Exception raised when LanguageTool API fails."""
@@ -34,38 +89,48 @@ class LanguageToolService:
         self.settings = get_settings()
         self.base_url = self.settings.languagetool_url
         self.timeout = self.settings.languagetool_timeout
+        self.chunk_threshold = self.settings.languagetool_chunk_threshold
+        self.max_concurrency = self.settings.languagetool_max_concurrency
+        self.chunker = TextChunker()
+        self._results: LRUCache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        # Checks currently running, so concurrent identical checks share one
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, created on first use inside the event loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=HTTP_LIMITS
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _get_languagetool_code(self, language: str) -> str:
         """Map internal language code to LanguageTool code."""
-        lang_config = SUPPORTED_LANGUAGES.get(language, {})
-        return lang_config.get("languagetool_code", language)
+        return _LANGUAGETOOL_CODES.get(language, language)
 
     def _map_category(self, lt_category: str) -> IssueCategory:
         """Map LanguageTool category to internal category."""
-        category_map = {
-            "GRAMMAR": IssueCategory.GRAMMAR,
-            "TYPOS": IssueCategory.SPELLING,
-            "SPELLING": IssueCategory.SPELLING,
-            "PUNCTUATION": IssueCategory.PUNCTUATION,
-            "STYLE": IssueCategory.STYLE,
-            "TYPOGRAPHY": IssueCategory.TYPOGRAPHY,
-            "CASING": IssueCategory.TYPOGRAPHY,
-            "CONFUSED_WORDS": IssueCategory.GRAMMAR,
-            "REDUNDANCY": IssueCategory.STYLE,
-            "MISC": IssueCategory.OTHER,
-        }
-        return category_map.get(lt_category.upper(), IssueCategory.OTHER)
+        category = _CATEGORY_MAP.get(lt_category)
+        if category is None:
+            category = _CATEGORY_MAP.get(lt_category.upper(), IssueCategory.OTHER)
+        return category
 
     def _map_severity(self, lt_type: str) -> IssueSeverity:
         """Map LanguageTool issue type to severity."""
-        severity_map = {
-            "misspelling": IssueSeverity.ERROR,
-            "grammar": IssueSeverity.ERROR,
-            "style": IssueSeverity.STYLE,
-            "typographical": IssueSeverity.WARNING,
-            "hint": IssueSeverity.HINT,
-        }
-        return severity_map.get(lt_type.lower(), IssueSeverity.WARNING)
+        severity = _SEVERITY_MAP.get(lt_type)
+        if severity is None:
+            severity = _SEVERITY_MAP.get(lt_type.lower(), IssueSeverity.WARNING)
+        return severity
 
     async def check_text(
         self,
@@ -85,8 +150,115 @@ class LanguageToolService:
         Raises:
             LanguageToolError: If the API call fails
         """
+        key = (language, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        cached = self._results.get(key)
+        if cached is not None:
+            return list(cached)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._check_and_store(key, text, language))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._inflight_done(key, t))
+
+        # Shielded: one caller being cancelled must not fail the others
+        return list(await asyncio.shield(task))
+
+    def _inflight_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished check."""
+        self._inflight.pop(key, None)
+        # Mark the exception retrieved: if every waiter was cancelled, no
+        # caller reads it and asyncio would log it as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def _check_and_store(
+        self,
+        key: tuple,
+        text: str,
+        language: str
+    ) -> List[GrammarIssue]:
+        """Run a check and store its result in the cache."""
+        issues = await self._check_text(text, language)
+        self._results[key] = issues
+        return issues
+
+    def clear_cache(self) -> None:
+        """Drop all cached check results."""
+        self._results.clear()
+
+    async def _check_text(self, text: str, language: str) -> List[GrammarIssue]:
+        """Check text with LanguageTool, bypassing the result cache."""
         lt_language = self._get_languagetool_code(language)
 
+        # Long texts are checked as chunks in parallel; LanguageTool latency
+        # grows faster than linearly with text size
+        if len(text) > self.chunk_threshold:
+            spans = self._locate_chunks(text)
+            if spans:
+                return await self._check_chunks(spans, lt_language, language)
+
+        matches = await self._check(text, lt_language, language)
+        return self._parse_matches(matches, text)
+
+    def _locate_chunks(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Split text into (offset, chunk) pairs with exact document offsets.
+
+        Adjacent chunks (typically short paragraphs) are merged, separators
+        included, as long as the merged span stays within the chunker's
+        maximum size, so each request carries up to a full chunk of text.
+
+        Returns an empty list if a chunk cannot be located, in which case
+        the text is checked in one request.
+        """
+        max_size = self.chunker.max_chunk_size
+        bounds: List[Tuple[int, int]] = []
+        position = 0
+        for chunk in self.chunker.chunk_text(text):
+            start = text.find(chunk.text, position)
+            if start == -1:
+                return []
+            end = start + len(chunk.text)
+            if bounds and end - bounds[-1][0] <= max_size:
+                bounds[-1] = (bounds[-1][0], end)
+            else:
+                bounds.append((start, end))
+            position = end
+        return [(start, text[start:end]) for start, end in bounds]
+
+    async def _check_chunks(
+        self,
+        spans: List[Tuple[int, str]],
+        lt_language: str,
+        language: str
+    ) -> List[GrammarIssue]:
+        """Check chunks concurrently and merge issues in document order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def check_one(chunk: str) -> List[dict]:
+            async with semaphore:
+                return await self._check(chunk, lt_language, language)
+
+        results = await asyncio.gather(*(check_one(chunk) for _, chunk in spans))
+
+        issues = []
+        seen = set()
+        for (offset, chunk), matches in zip(spans, results):
+            for issue in self._parse_matches(matches, chunk, offset):
+                key = (issue.offset, issue.length, issue.rule_id)
+                if key not in seen:
+                    seen.add(key)
+                    issues.append(issue)
+        return issues
+
+    async def _check(self, text: str, lt_language: str, language: str) -> List[dict]:
+        """
+        Send one text to LanguageTool and return its raw matches.
+
+        Raises:
+            LanguageToolError: If the API call fails
+        """
         payload = {
             "text": text,
             "language": lt_language,
@@ -94,13 +266,9 @@ class LanguageToolService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/check",
-                    data=payload
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self.client.post("/check", data=payload)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
         except httpx.TimeoutException:
             logger.error(f"LanguageTool timeout for language {language}")
@@ -112,67 +280,83 @@ class LanguageToolService:
             logger.error(f"LanguageTool error: {str(e)}")
             raise LanguageToolError(f"LanguageTool error: {str(e)}")
 
-        return self._parse_matches(data.get("matches", []), text)
+        return data.get("matches", [])
 
     def _parse_matches(
         self,
         matches: List[dict],
-        original_text: str
+        original_text: str,
+        base_offset: int = 0
     ) -> List[GrammarIssue]:
-        """Parse LanguageTool matches into GrammarIssue models."""
-        issues = []
+        """
+        Parse LanguageTool matches into GrammarIssue models.
 
-        for match in matches:
-            offset = match.get("offset", 0)
-            length = match.get("length", 0)
-
-            # Extract the original text span
-            original_span = original_text[offset:offset + length] if length > 0 else ""
-
-            # Extract suggestions
-            replacements = match.get("replacements", [])
-            suggestions = [r.get("value", "") for r in replacements[:5]]  # Limit to 5
-
-            # Get context
-            context_data = match.get("context", {})
-            context = context_data.get("text", "")
-
-            # Map category
-            rule = match.get("rule", {})
-            category_data = rule.get("category", {})
-            category_id = category_data.get("id", "OTHER")
-
-            issue = GrammarIssue(
-                offset=offset,
-                length=length,
-                message=match.get("message", ""),
-                rule_id=rule.get("id", "UNKNOWN"),
-                category=self._map_category(category_id),
-                severity=self._map_severity(match.get("type", {}).get("typeName", "other")),
-                original_text=original_span,
-                suggestions=suggestions,
-                context=context if context else None
-            )
-            issues.append(issue)
+        Offsets are relative to original_text and shifted by base_offset,
+        the position of original_text within the full document. Matches
+        with an empty span or a negative offset are dropped: issues are
+        built without validation and must not break the model's bounds.
+        """
+        build = self._build_issue
+        return [
+            build(match, original_text, base_offset) for match in matches
+            if match.get("length", 0) >= 1 and match.get("offset", 0) >= 0
+        ]
 
-        return issues
+    def _build_issue(
+        self,
+        match: dict,
+        original_text: str,
+        base_offset: int
+    ) -> GrammarIssue:
+        """Build one GrammarIssue from a LanguageTool match."""
+        get = match.get
+        offset = get("offset", 0)
+        length = get("length", 0)
+
+        # Extract the original text span
+        original_span = original_text[offset:offset + length]
+
+        # Extract suggestions
+        replacements = get("replacements", _NO_REPLACEMENTS)
+        suggestions = [r.get("value", "") for r in replacements[:5]]  # Limit to 5
+
+        # Get context
+        context = get("context", _EMPTY).get("text", "")
+
+        # Map category
+        rule = get("rule", _EMPTY)
+        category = self._map_category(rule.get("category", _EMPTY).get("id", "OTHER"))
+        severity = self._map_severity(get("type", _EMPTY).get("typeName", "other"))
+
+        # Field types are known here; skip pydantic validation per match
+        return GrammarIssue.model_construct(
+            offset=base_offset + offset,
+            length=length,
+            message=get("message", ""),
+            # Rule ids repeat across matches; interned, they are shared and
+            # compare by identity in the validator's lookups
+            rule_id=sys.intern(rule.get("id", "UNKNOWN")),
+            category=category,
+            severity=severity,
+            original_text=original_span,
+            suggestions=suggestions,
+            context=context if context else None
+        )
 
     async def is_available(self) -> bool:
         """Check if LanguageTool service is available."""
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/languages")
-                return response.status_code == 200
+            response = await self.client.get("/languages", timeout=5)
+            return response.status_code == 200
         except Exception:
             return False
 
     async def get_supported_languages(self) -> List[dict]:
         """Get list of languages supported by LanguageTool."""
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/languages")
-                response.raise_for_status()
-                return response.json()
+            response = await self.client.get("/languages", timeout=5)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to get languages: {str(e)}")
             return []
@@ -7,12 +7,15 @@ correction and rewrite generation. This is Stage 2 of the pipeline.
 Designed to work with any OpenAI-compatible endpoint (local LLM, Ollama, etc.)
 """
 
+import hashlib
 import httpx
-import json
 import logging
-import re
 from typing import Optional, Dict, Any, List
 
+import orjson
+from cachetools import LRUCache
+from pydantic import BaseModel, ValidationError
+
 from ..config import get_settings, SUPPORTED_LANGUAGES, TONE_DESCRIPTIONS
 from ..models.request import Tone
 from ..models.response import GrammarIssue, RewriteSuggestion, Explanation
@@ -20,12 +23,74 @@ from ..prompts.grammar_prompts import build_grammar_prompt
 
 logger = logging.getLogger(__name__)
 
+# Number of completions kept, keyed by prompt digest; the prompt already
+# encodes language, tone, mode, text and issues
+COMPLETION_CACHE_SIZE = 256
+
+SYSTEM_PROMPT = (
+    "You are a precise grammar correction assistant. You MUST respond with "
+    "valid JSON only. Never include any text outside the JSON object."
+)
+
+# Connection pool shared by all LLM calls (keep-alive across requests)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
 
 class LLMError(Exception):
     """Exception raised when LLM API fails."""
     pass
 
 
+class _LLMReply(BaseModel):
+    """
+    Expected shape of the LLM JSON reply.
+
+    pydantic-core decodes well-formed replies straight into the response
+    models; anything that does not fit goes through the lenient parser.
+    """
+    corrected_text: Optional[str] = None
+    rewrites: List[RewriteSuggestion] = []
+    explanations: List[Explanation] = []
+
+
+class JSONObjectScanner:
+    """
+    Incrementally tracks brace depth over streamed text.
+
+    Reports when the first top-level JSON object is complete, so a
+    streamed completion can be cut off without waiting for trailing tokens.
+    Braces inside string literals are ignored.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.complete = False
+
+    def feed(self, text: str) -> bool:
+        """Scan more text; returns True once the top-level object is closed."""
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                # Strings only matter inside the object
+                self.in_string = self.depth > 0
+            elif char == "{":
+                self.depth += 1
+            elif char == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.complete = True
+                    return True
+        return False
+
+
 class LLMResponse:
     """Parsed response from the LLM."""
 
@@ -38,6 +103,8 @@ class LLMResponse:
         self.corrected_text = corrected_text
         self.rewrites = rewrites
         self.explanations = explanations
+        # Completion cache key this response was parsed from, if any
+        self.cache_key: Optional[bytes] = None
 
 
 class LLMService:
@@ -58,6 +125,32 @@ class LLMService:
         self.temperature = self.settings.llm_temperature
         self.max_tokens = self.settings.llm_max_tokens
         self.timeout = self.settings.llm_timeout
+        self.stream = self.settings.llm_stream
+        self._completions: LRUCache = LRUCache(maxsize=COMPLETION_CACHE_SIZE)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Request parts that never change, built once instead of per call
+        self._system_message = {"role": "system", "content": SYSTEM_PROMPT}
+        self._headers = {"Content-Type": "application/json"}
+        self._base_payload = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            # Note: response_format removed for compatibility with local LLMs
+        }
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, created on first use inside the event loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate_correction(
         self,
@@ -98,19 +191,44 @@ class LLMService:
             include_rewrites=include_rewrites
         )
 
-        # Call the LLM
+        # Call the LLM and parse the JSON response
         try:
-            response_text = await self._call_llm(prompt)
-            if response_text is None:
-                return None
-
-            # Parse the JSON response
-            return self._parse_response(response_text, text)
+            return await self._complete(prompt, text)
 
         except Exception as e:
             logger.error(f"LLM generation failed: {str(e)}")
             return None
 
+    def clear_cache(self) -> None:
+        """Drop all cached completions."""
+        self._completions.clear()
+
+    async def _complete(self, prompt: str, original_text: str) -> Optional[LLMResponse]:
+        """
+        Get a parsed completion for a prompt, reusing cached completions.
+
+        Only completions that parse are cached, so a malformed reply is
+        requested again on resubmission instead of being replayed; callers
+        discard() responses that fail validation for the same reason.
+        """
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        content = self._completions.get(key)
+        if content is None:
+            content = await self._call_llm(prompt)
+            if content is None:
+                return None
+
+        response = self._parse_response(content, original_text)
+        if response is not None:
+            self._completions[key] = content
+            response.cache_key = key
+        return response
+
+    def discard(self, response: LLMResponse) -> None:
+        """Drop the cached completion of a response that failed validation."""
+        if response.cache_key is not None:
+            self._completions.pop(response.cache_key, None)
+
     async def _call_llm(self, prompt: str) -> Optional[str]:
         """
         Call the OpenAI-compatible LLM API.
@@ -122,46 +240,34 @@ class LLMService:
             The response text, or None on failure
         """
         payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a precise grammar correction assistant. You MUST respond with valid JSON only. Never include any text outside the JSON object."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens
-            # Note: response_format removed for compatibility with local LLMs
-        }
-
-        headers = {
-            "Content-Type": "application/json"
+            **self._base_payload,
+            "messages": [self._system_message, {"role": "user", "content": prompt}]
         }
+        headers = self._headers
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                data = response.json()
+            if self.stream:
+                payload["stream"] = True
+                return await self._stream_llm(payload, headers)
+
+            response = await self.client.post(
+                self.base_url,
+                content=orjson.dumps(payload),
+                headers=headers
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-                # Extract the response content
-                choices = data.get("choices", [])
-                if not choices:
-                    logger.error("LLM returned no choices")
-                    return None
+            # Extract the response content
+            choices = data.get("choices", [])
+            if not choices:
+                logger.error("LLM returned no choices")
+                return None
 
-                message = choices[0].get("message", {})
-                content = message.get("content", "")
+            message = choices[0].get("message", {})
+            content = message.get("content", "")
 
-                return content.strip()
+            return content.strip()
 
         except httpx.TimeoutException:
             logger.error("LLM request timeout")
@@ -173,6 +279,51 @@ class LLMService:
             logger.error(f"LLM error: {str(e)}")
             raise LLMError(f"LLM error: {str(e)}")
 
+    async def _stream_llm(self, payload: Dict[str, Any], headers: Dict[str, str]) -> Optional[str]:
+        """
+        Stream a completion and return its content.
+
+        Server-sent deltas are accumulated until the top-level JSON object
+        closes; the stream is then closed, which stops generation of any
+        trailing tokens. Servers that ignore "stream" and answer with a
+        plain JSON body are handled as a regular completion.
+        """
+        async with self.client.stream(
+            "POST",
+            self.base_url,
+            content=orjson.dumps(payload),
+            headers=headers
+        ) as response:
+            response.raise_for_status()
+
+            if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                data = orjson.loads(await response.aread())
+                choices = data.get("choices", [])
+                if not choices:
+                    logger.error("LLM returned no choices")
+                    return None
+                return choices[0].get("message", {}).get("content", "").strip()
+
+            parts = []
+            scanner = JSONObjectScanner()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+
+                choices = orjson.loads(data).get("choices", [])
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    if scanner.feed(delta):
+                        break
+
+        return "".join(parts).strip()
+
     def _parse_response(self, response_text: str, original_text: str) -> Optional[LLMResponse]:
         """
         Parse the LLM JSON response.
@@ -185,14 +336,31 @@ class LLMService:
             Parsed LLMResponse, or None on parse failure
         """
         try:
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if not json_match:
+            # Extract the outermost JSON object: from the first "{" to the
+            # last "}" (usually the whole response, as the prompt demands)
+            start = response_text.find("{")
+            end = response_text.rfind("}")
+            if start == -1 or end < start:
                 logger.error("No JSON found in LLM response")
                 return None
 
-            json_str = json_match.group()
-            data = json.loads(json_str)
+            json_str = response_text[start:end + 1]
+
+            # Fast path: typed decode of a well-formed reply in one pass
+            try:
+                reply = _LLMReply.model_validate_json(json_str)
+                return LLMResponse(
+                    corrected_text=(
+                        original_text if reply.corrected_text is None
+                        else reply.corrected_text
+                    ),
+                    rewrites=reply.rewrites,
+                    explanations=reply.explanations
+                )
+            except ValidationError:
+                pass
+
+            data = orjson.loads(json_str)
 
             # Extract corrected text
             corrected_text = data.get("corrected_text", original_text)
@@ -237,7 +405,7 @@ class LLMService:
                 explanations=explanations
             )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM JSON: {e}")
             return None
         except Exception as e:
@@ -273,11 +441,7 @@ class LLMService:
         )
 
         try:
-            response_text = await self._call_llm(prompt)
-            if response_text is None:
-                return None
-
-            return self._parse_response(response_text, text)
+            return await self._complete(prompt, text)
 
         except Exception as e:
             logger.error(f"LLM rewrite generation failed: {str(e)}")
@@ -296,12 +460,12 @@ class LLMService:
                 "temperature": 0
             }
 
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                return response.status_code == 200
+            response = await self.client.post(
+                self.base_url,
+                content=orjson.dumps(payload),
+                headers=self._headers,
+                timeout=10
+            )
+            return response.status_code == 200
         except Exception:
             return False
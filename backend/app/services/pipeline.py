@@ -8,8 +8,10 @@ This is the core orchestration component that:
 4. Falls back to rule-based correction if validation fails
 """
 
+import asyncio
 import logging
-from typing import Optional, List
+import re
+from typing import Dict, Optional, List
 from dataclasses import dataclass
 
 from .languagetool import LanguageToolService, LanguageToolError
@@ -19,6 +21,8 @@ from ..models.request import CheckRequest, CheckMode, Tone
 from ..models.response import (
     CheckResponse,
     GrammarIssue,
+    IssueCategory,
+    IssueSeverity,
     RewriteSuggestion,
     Explanation
 )
@@ -26,6 +30,21 @@ from ..utils.chunker import TextChunker
 
 logger = logging.getLogger(__name__)
 
+# In strict mode the LLM is skipped when more than this share of issues are
+# spelling/typography fixes with a single unambiguous suggestion
+SIMPLE_FIX_RATIO = 0.9
+_SIMPLE_CATEGORIES = frozenset({IssueCategory.SPELLING, IssueCategory.TYPOGRAPHY})
+
+# Upper bound on issues listed in the LLM prompt; prompt size drives LLM
+# latency, and the most severe issues are kept
+MAX_PROMPT_ISSUES = 30
+_SEVERITY_RANK = {
+    IssueSeverity.ERROR: 0,
+    IssueSeverity.WARNING: 1,
+    IssueSeverity.STYLE: 2,
+    IssueSeverity.HINT: 3,
+}
+
 
 class GrammarPipeline:
     """
@@ -62,10 +81,23 @@ class GrammarPipeline:
 
         logger.info(f"Processing grammar check: {len(text)} chars, lang={language}")
 
+        # In style mode, start the issue-free LLM pass while LanguageTool
+        # runs; it is the next call if no issues are found, and cancelled
+        # otherwise
+        speculative: Optional[asyncio.Task] = None
+        if mode == CheckMode.STYLE:
+            speculative = asyncio.create_task(self.llm.generate_rewrites_only(
+                text=text,
+                language=language,
+                tone=tone
+            ))
+
         # ===== STAGE 1: LanguageTool Analysis =====
+        speculative_used = False
         try:
             issues = await self.languagetool.check_text(text, language)
             logger.info(f"LanguageTool found {len(issues)} issues")
+            speculative_used = not issues
         except LanguageToolError as e:
             logger.error(f"LanguageTool failed: {e}")
             # Return original text with error indication
@@ -79,17 +111,24 @@ class GrammarPipeline:
                 fallback_used=True,
                 language=language
             )
+        finally:
+            # Never leave the speculative pass running unobserved
+            if speculative is not None and not speculative_used:
+                speculative.cancel()
 
         # If no issues found, still call LLM to check for issues LanguageTool might have missed
         if not issues:
             logger.info("No grammar issues from LanguageTool, calling LLM for additional checking")
             include_rewrites = mode == CheckMode.STYLE
             try:
-                llm_response = await self.llm.generate_rewrites_only(
-                    text=text,
-                    language=language,
-                    tone=tone
-                )
+                if speculative is not None:
+                    llm_response = await speculative
+                else:
+                    llm_response = await self.llm.generate_rewrites_only(
+                        text=text,
+                        language=language,
+                        tone=tone
+                    )
                 if llm_response:
                     # Check if LLM found issues that LanguageTool missed
                     llm_found_issues = llm_response.corrected_text != text
@@ -106,6 +145,7 @@ class GrammarPipeline:
                         if not validation.is_valid:
                             logger.warning("LLM corrections failed validation, keeping original")
                             corrected = text
+                            self.llm.discard(llm_response)
 
                     # Convert LLM explanations to structured issues
                     llm_issues = self._explanations_to_issues(text, llm_response.explanations)
@@ -137,6 +177,24 @@ class GrammarPipeline:
         # Generate rule-based fallback correction
         fallback_text = self._apply_rule_based_fixes(text, issues)
 
+        # Trivially fixable text gains nothing from the LLM; LanguageTool's
+        # single suggestions are the correction
+        if mode != CheckMode.STYLE and self._is_simple_fix(issues):
+            logger.info("Only simple fixes found, skipping LLM")
+            return CheckResponse(
+                original_text=text,
+                corrected_text=fallback_text,
+                issues=issues,
+                rewrites=[],
+                explanations=(
+                    self._generate_basic_explanations(issues)
+                    if include_explanations else []
+                ),
+                validation_passed=False,  # Not re-checked, like every fallback
+                fallback_used=True,
+                language=language
+            )
+
         # ===== STAGE 2: LLM Semantic Correction =====
         include_rewrites = mode == CheckMode.STYLE
         llm_response = None
@@ -149,7 +207,7 @@ class GrammarPipeline:
         try:
             llm_response = await self.llm.generate_correction(
                 text=text,
-                issues=issues,
+                issues=self._select_prompt_issues(issues, mode),
                 language=language,
                 tone=tone,
                 include_rewrites=include_rewrites
@@ -174,16 +232,20 @@ class GrammarPipeline:
                         f"Validation failed: {validation.message}. "
                         f"New issues: {len(validation.new_issues)}"
                     )
-                    # Generate basic explanations for rule-based fixes
-                    explanations = self._generate_basic_explanations(issues)
+                    # Request a fresh correction next time instead of replaying
+                    self.llm.discard(llm_response)
             else:
                 # LLM failed, use fallback
                 used_fallback = True
-                explanations = self._generate_basic_explanations(issues)
 
         except LLMError as e:
             logger.error(f"LLM failed: {e}. Using fallback.")
             used_fallback = True
+
+        if not include_explanations:
+            explanations = []
+        elif used_fallback:
+            # Basic explanations for rule-based fixes, only built when returned
             explanations = self._generate_basic_explanations(issues)
 
         return CheckResponse(
@@ -191,12 +253,54 @@ class GrammarPipeline:
             corrected_text=final_text,
             issues=issues,
             rewrites=rewrites,
-            explanations=explanations if include_explanations else [],
+            explanations=explanations,
             validation_passed=validation_passed,
             fallback_used=used_fallback,
             language=language
         )
 
+    def _is_simple_fix(self, issues: List[GrammarIssue]) -> bool:
+        """Check if nearly all issues are single-suggestion spelling/typography fixes."""
+        simple = sum(
+            1 for issue in issues
+            if issue.category in _SIMPLE_CATEGORIES and len(issue.suggestions) == 1
+        )
+        return simple > SIMPLE_FIX_RATIO * len(issues)
+
+    def _select_prompt_issues(
+        self,
+        issues: List[GrammarIssue],
+        mode: CheckMode
+    ) -> List[GrammarIssue]:
+        """
+        Reduce the issues sent to the LLM to keep the prompt small.
+
+        Duplicates are dropped, style issues are left out outside style
+        mode (unless nothing else remains), and at most MAX_PROMPT_ISSUES
+        of the most severe issues are kept, in document order.
+        """
+        seen = set()
+        selected = []
+        for issue in issues:
+            key = (issue.offset, issue.length, issue.rule_id)
+            if key not in seen:
+                seen.add(key)
+                selected.append(issue)
+
+        if mode != CheckMode.STYLE:
+            substantive = [i for i in selected if i.category != IssueCategory.STYLE]
+            if substantive:
+                selected = substantive
+
+        if len(selected) > MAX_PROMPT_ISSUES:
+            kept = sorted(
+                range(len(selected)),
+                key=lambda i: _SEVERITY_RANK.get(selected[i].severity, len(_SEVERITY_RANK))
+            )[:MAX_PROMPT_ISSUES]
+            selected = [selected[i] for i in sorted(kept)]
+
+        return selected
+
     def _apply_rule_based_fixes(
         self,
         text: str,
@@ -206,37 +310,40 @@ class GrammarPipeline:
         Apply rule-based fixes using LanguageTool suggestions.
 
         This is the fallback method when LLM fails or produces invalid output.
-        We apply suggestions in reverse order to maintain correct offsets.
+        The text is rebuilt in one forward pass; issues overlapping an
+        already applied fix are skipped.
         """
-        # Sort issues by offset in descending order to apply from end to start
-        sorted_issues = sorted(issues, key=lambda x: x.offset, reverse=True)
-
-        result = text
-        for issue in sorted_issues:
-            if issue.suggestions:
+        fixable = [issue for issue in issues if issue.suggestions]
+        if not fixable:
+            return text
+
+        parts = []
+        position = 0
+        for issue in sorted(fixable, key=lambda x: x.offset):
+            if issue.offset >= position:
                 # Use the first suggestion
-                suggestion = issue.suggestions[0]
-                start = issue.offset
-                end = issue.offset + issue.length
-                result = result[:start] + suggestion + result[end:]
+                parts.append(text[position:issue.offset])
+                parts.append(issue.suggestions[0])
+                position = issue.offset + issue.length
 
-        return result
+        parts.append(text[position:])
+        return "".join(parts)
 
     def _generate_basic_explanations(
         self,
         issues: List[GrammarIssue]
     ) -> List[Explanation]:
         """Generate basic explanations from LanguageTool issues."""
-        explanations = []
-        for issue in issues:
-            if issue.suggestions:
-                explanations.append(Explanation(
-                    span=issue.original_text,
-                    original=issue.original_text,
-                    corrected=issue.suggestions[0],
-                    reason=issue.message
-                ))
-        return explanations
+        return [
+            Explanation.model_construct(
+                span=issue.original_text,
+                original=issue.original_text,
+                corrected=issue.suggestions[0],
+                reason=issue.message
+            )
+            for issue in issues
+            if issue.suggestions
+        ]
 
     def _explanations_to_issues(
         self,
@@ -248,34 +355,80 @@ class GrammarPipeline:
 
         Used when LLM finds issues that LanguageTool missed.
         """
+        relevant = [
+            exp for exp in explanations
+            if exp.original and exp.corrected and exp.original != exp.corrected
+        ]
+        if not relevant:
+            return []
+
+        # Locate all phrases in one scan; repeated phrases are assigned
+        # successive occurrences in document order
+        phrases = sorted({exp.original for exp in relevant}, key=len, reverse=True)
+        pattern = re.compile("|".join(map(re.escape, phrases)))
+        occurrences: Dict[str, List[int]] = {}
+        for match in pattern.finditer(text):
+            occurrences.setdefault(match.group(), []).append(match.start())
+        used: Dict[str, int] = {}
+
         issues = []
-        for exp in explanations:
-            if exp.original and exp.corrected and exp.original != exp.corrected:
-                # Find the offset of the original text
+        for exp in relevant:
+            found = occurrences.get(exp.original, [])
+            index = used.get(exp.original, 0)
+            used[exp.original] = index + 1
+            if index < len(found):
+                offset = found[index]
+            else:
+                # Shadowed by a longer phrase or repeated too often
                 offset = text.find(exp.original)
                 if offset == -1:
                     offset = 0  # Fallback if not found
 
-                issues.append(GrammarIssue(
-                    offset=offset,
-                    length=len(exp.original),
-                    message=exp.reason or "LLM detected issue",
-                    rule_id="LLM_DETECTED",
-                    category="grammar",
-                    severity="warning",
-                    original_text=exp.original,
-                    suggestions=[exp.corrected],
-                    context=text[max(0, offset-20):offset+len(exp.original)+20]
-                ))
+            # Built from validated explanations; skip re-validation
+            issues.append(GrammarIssue.model_construct(
+                offset=offset,
+                length=len(exp.original),
+                message=exp.reason or "LLM detected issue",
+                rule_id="LLM_DETECTED",
+                category=IssueCategory.GRAMMAR,
+                severity=IssueSeverity.WARNING,
+                original_text=exp.original,
+                suggestions=[exp.corrected],
+                context=text[max(0, offset-20):offset+len(exp.original)+20]
+            ))
         return issues
 
+    def clear_caches(self) -> None:
+        """Drop cached LanguageTool results and LLM completions."""
+        self.languagetool.clear_cache()
+        self.llm.clear_cache()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients of the underlying services."""
+        await self.languagetool.aclose()
+        await self.llm.aclose()
+
     async def check_services(self) -> dict:
-        """Check availability of all services."""
-        lt_available = await self.languagetool.is_available()
-        llm_available = await self.llm.is_available()
+        """Check availability of all services, probing them concurrently."""
+        lt_available, llm_available = await asyncio.gather(
+            self.languagetool.is_available(),
+            self.llm.is_available()
+        )
 
         return {
             "languagetool": lt_available,
             "llm": llm_available,
             "pipeline_ready": lt_available  # LLM is optional (has fallback)
         }
+
+
+# Global pipeline instance
+_pipeline_instance: Optional[GrammarPipeline] = None
+
+
+def get_pipeline() -> GrammarPipeline:
+    """Get the shared pipeline instance."""
+    global _pipeline_instance
+    if _pipeline_instance is None:
+        _pipeline_instance = GrammarPipeline()
+    return _pipeline_instance
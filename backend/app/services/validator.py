@@ -6,6 +6,7 @@ the user. After the LLM generates a correction, we re-run LanguageTool on
 the corrected text to verify no new errors were introduced.
 """
 
+import asyncio
 import logging
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
@@ -16,7 +17,12 @@ from ..models.response import GrammarIssue
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _collapse_whitespace(text: str) -> str:
+    """Normalize runs of whitespace to single spaces for comparison."""
+    return " ".join(text.split())
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating LLM output."""
     is_valid: bool
@@ -24,6 +30,29 @@ class ValidationResult:
     message: str
 
 
+class _OriginalIssueIndex:
+    """
+    Set-based lookup of the original issues.
+
+    Built once per validation, so each re-checked issue is matched in
+    constant time instead of scanning every original issue.
+    """
+
+    __slots__ = ("rule_texts", "texts")
+
+    def __init__(self, original_issues: List[GrammarIssue]):
+        self.rule_texts = {(i.rule_id, i.original_text.lower()) for i in original_issues}
+        self.texts = {i.original_text for i in original_issues}
+
+    def contains_similar(self, issue: GrammarIssue) -> bool:
+        """Check if an issue matches an original issue."""
+        # Same error text (might have shifted position)
+        if issue.original_text in self.texts:
+            return True
+        # Same rule ID and similar text
+        return (issue.rule_id, issue.original_text.lower()) in self.rule_texts
+
+
 class ValidationService:
     """
     Validates LLM corrections by re-checking with LanguageTool.
@@ -66,24 +95,65 @@ class ValidationService:
                 language
             )
         except LanguageToolError as e:
-            logger.error(f"Validation failed - LanguageTool error: {e}")
-            # If we can't validate, reject the LLM output to be safe
-            return ValidationResult(
-                is_valid=False,
-                new_issues=[],
-                message=f"Validation failed: {str(e)}"
-            )
+            return self._recheck_failed(e)
+
+        return self._evaluate(new_issues, original_issues, strict)
+
+    async def validate_many(
+        self,
+        candidates: List[str],
+        original_issues: List[GrammarIssue],
+        language: str = "nl",
+        strict: bool = True
+    ) -> List[ValidationResult]:
+        """
+        Validate several candidate corrections concurrently.
+
+        All LanguageTool re-checks are in flight at once, so the wall time
+        is that of the slowest check rather than their sum.
+
+        Returns:
+            One ValidationResult per candidate, in the same order
+        """
+        rechecks = await asyncio.gather(
+            *(self.languagetool.check_text(text, language) for text in candidates),
+            return_exceptions=True
+        )
 
-        # Filter out issues that were in the original text (same position/rule)
-        original_rules = {(i.offset, i.rule_id) for i in original_issues}
+        results = []
+        for new_issues in rechecks:
+            if isinstance(new_issues, LanguageToolError):
+                results.append(self._recheck_failed(new_issues))
+            elif isinstance(new_issues, BaseException):
+                raise new_issues
+            else:
+                results.append(self._evaluate(new_issues, original_issues, strict))
+        return results
+
+    def _recheck_failed(self, error: LanguageToolError) -> ValidationResult:
+        """Result for a correction that could not be re-checked."""
+        logger.error(f"Validation failed - LanguageTool error: {error}")
+        # If we can't validate, reject the LLM output to be safe
+        return ValidationResult(
+            is_valid=False,
+            new_issues=[],
+            message=f"Validation failed: {str(error)}"
+        )
+
+    def _evaluate(
+        self,
+        new_issues: List[GrammarIssue],
+        original_issues: List[GrammarIssue],
+        strict: bool
+    ) -> ValidationResult:
+        """Compare the issues of a corrected text against the original ones."""
+        original_index = _OriginalIssueIndex(original_issues)
 
         # Identify truly new issues
         truly_new_issues = []
         for issue in new_issues:
-            key = (issue.offset, issue.rule_id)
-
             # Skip if this was an original issue (might be at different offset)
-            if self._is_similar_issue(issue, original_issues):
+            if original_index.contains_similar(issue):
                 continue
 
             # In non-strict mode, skip style/typography issues
@@ -128,17 +198,7 @@ class ValidationService:
 
         This accounts for offset shifts due to corrections.
         """
-        for orig in original_issues:
-            # Same rule ID and similar text
-            if issue.rule_id == orig.rule_id:
-                if issue.original_text.lower() == orig.original_text.lower():
-                    return True
-
-            # Same error text (might have shifted position)
-            if issue.original_text == orig.original_text:
-                return True
-
-        return False
+        return _OriginalIssueIndex(original_issues).contains_similar(issue)
 
     async def validate_and_choose(
         self,
@@ -159,6 +219,15 @@ class ValidationService:
         Returns:
             Tuple of (chosen_text, used_fallback, validation_result)
         """
+        # The fallback is built from LanguageTool's own suggestions, so an LLM
+        # text matching it (up to whitespace) needs no re-check
+        if llm_text == fallback_text or _collapse_whitespace(llm_text) == _collapse_whitespace(fallback_text):
+            return fallback_text, False, ValidationResult(
+                is_valid=True,
+                new_issues=[],
+                message="Validation passed (matches rule-based correction)"
+            )
+
         # Validate LLM output
         validation = await self.validate_correction(
             llm_text,
@@ -6,49 +6,82 @@ and LLM calls for the same text.
 """
 
 import hashlib
+import itertools
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from threading import Lock
 
 from ..config import get_settings
 
 
-@dataclass
+# Number of independently locked cache shards (a power of two)
+SHARD_COUNT = 16
+
+# Small integer code per (language, mode) pair, assigned on first use and
+# placed above the 128-bit text digest in the key. The counter hands out
+# unique codes even when two threads register pairs at once.
+_PARAM_CODES: Dict[tuple, int] = {}
+_next_param_code = itertools.count(1)
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """A cached result with timestamp."""
+    """A cached result with its time.monotonic() write timestamp."""
     value: Any
     timestamp: float
     hits: int = 0
 
 
+class _Shard:
+    """One slice of the cache with its own lock and statistics."""
+
+    __slots__ = ("entries", "lock", "stats")
+
+    def __init__(self):
+        # Kept in LRU order: least recently used first
+        self.entries: "OrderedDict[int, CacheEntry]" = OrderedDict()
+        self.lock = Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+
 class GrammarCache:
     """
     In-memory cache for grammar check results.
 
     Features:
     - TTL-based expiration
-    - Thread-safe operations
+    - Thread-safe operations, striped over SHARD_COUNT locks
     - Hit counting for analytics
-    - Memory-bounded (max entries)
+    - Memory-bounded (max entries), least recently used evicted first
     """
 
     def __init__(self, ttl: int = None, max_entries: int = 1000):
         settings = get_settings()
         self.ttl = ttl or settings.cache_ttl
         self.max_entries = max_entries
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = Lock()
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "evictions": 0
-        }
+        # Each shard holds its share of the capacity
+        self._shard_capacity = max(1, max_entries // SHARD_COUNT)
+        self._shards: List[_Shard] = [_Shard() for _ in range(SHARD_COUNT)]
 
-    def _make_key(self, text: str, language: str, mode: str = None) -> str:
+    def _make_key(self, text: str, language: str, mode: str = None) -> int:
         """Generate a cache key from text and parameters."""
-        content = f"{text}|{language}|{mode or ''}"
-        return hashlib.md5(content.encode()).hexdigest()
+        params = (language, mode or "")
+        code = _PARAM_CODES.get(params)
+        if code is None:
+            code = _PARAM_CODES.setdefault(params, next(_next_param_code))
+
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        return (code << 128) | int.from_bytes(digest, "little")
+
+    def _shard(self, key: int) -> _Shard:
+        """Select the shard for a key; keys are uniform hash digests."""
+        return self._shards[key & (SHARD_COUNT - 1)]
 
     def get(self, text: str, language: str, mode: str = None) -> Optional[Any]:
         """
@@ -63,22 +96,25 @@ class GrammarCache:
             Cached value if valid, None otherwise
         """
         key = self._make_key(text, language, mode)
+        shard = self._shard(key)
+        now = time.monotonic()
 
-        with self._lock:
-            entry = self._cache.get(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
 
             if entry is None:
-                self._stats["misses"] += 1
+                shard.stats["misses"] += 1
                 return None
 
             # Check TTL
-            if time.time() - entry.timestamp > self.ttl:
-                del self._cache[key]
-                self._stats["misses"] += 1
+            if now - entry.timestamp > self.ttl:
+                shard.entries.pop(key, None)
+                shard.stats["misses"] += 1
                 return None
 
+            shard.entries.move_to_end(key)
             entry.hits += 1
-            self._stats["hits"] += 1
+            shard.stats["hits"] += 1
             return entry.value
 
     def set(
@@ -98,32 +134,31 @@ class GrammarCache:
             mode: Check mode (optional)
         """
         key = self._make_key(text, language, mode)
+        shard = self._shard(key)
+        now = time.monotonic()
 
-        with self._lock:
-            # Evict old entries if at capacity
-            if len(self._cache) >= self.max_entries:
-                self._evict_oldest()
+        with shard.lock:
+            # Evict old entries if at capacity; overwriting a key needs no room
+            if key not in shard.entries and len(shard.entries) >= self._shard_capacity:
+                self._evict_oldest(shard)
 
-            self._cache[key] = CacheEntry(
+            shard.entries[key] = CacheEntry(
                 value=value,
-                timestamp=time.time()
+                timestamp=now
             )
+            shard.entries.move_to_end(key)
 
-    def _evict_oldest(self) -> None:
-        """Evict the oldest entries to make room."""
-        if not self._cache:
+    def _evict_oldest(self, shard: _Shard) -> None:
+        """Evict the least recently used entries of a shard to make room."""
+        entries = shard.entries
+        if not entries:
             return
 
-        # Sort by timestamp and remove oldest 10%
-        sorted_keys = sorted(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].timestamp
-        )
-
-        evict_count = max(1, len(sorted_keys) // 10)
-        for key in sorted_keys[:evict_count]:
-            del self._cache[key]
-            self._stats["evictions"] += 1
+        # Remove the least recently used 10% from the front of the order
+        evict_count = max(1, len(entries) // 10)
+        for _ in range(evict_count):
+            entries.popitem(last=False)
+        shard.stats["evictions"] += evict_count
 
     def invalidate(self, text: str, language: str, mode: str = None) -> bool:
         """
@@ -133,55 +168,65 @@ class GrammarCache:
             True if entry was found and removed
         """
         key = self._make_key(text, language, mode)
+        shard = self._shard(key)
 
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        with shard.lock:
+            return shard.entries.pop(key, None) is not None
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        with self._lock:
-            self._cache.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        with self._lock:
-            total_requests = self._stats["hits"] + self._stats["misses"]
-            hit_rate = (
-                self._stats["hits"] / total_requests
-                if total_requests > 0 else 0
-            )
+        """Get cache statistics, aggregated from per-shard snapshots."""
+        entries = hits = misses = evictions = 0
+        for shard in self._shards:
+            with shard.lock:
+                entries += len(shard.entries)
+                hits += shard.stats["hits"]
+                misses += shard.stats["misses"]
+                evictions += shard.stats["evictions"]
+
+        total_requests = hits + misses
+        hit_rate = (
+            hits / total_requests
+            if total_requests > 0 else 0
+        )
 
-            return {
-                "entries": len(self._cache),
-                "max_entries": self.max_entries,
-                "hits": self._stats["hits"],
-                "misses": self._stats["misses"],
-                "evictions": self._stats["evictions"],
-                "hit_rate": round(hit_rate, 3)
-            }
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": round(hit_rate, 3)
+        }
 
     def cleanup_expired(self) -> int:
         """
         Remove all expired entries.
 
+        Shards are kept in access order while the TTL runs from the write,
+        so every entry has to be checked.
+
         Returns:
             Number of entries removed
         """
-        now = time.time()
+        now = time.monotonic()
         removed = 0
 
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if now - entry.timestamp > self.ttl
-            ]
+        for shard in self._shards:
+            with shard.lock:
+                expired_keys = [
+                    key for key, entry in shard.entries.items()
+                    if now - entry.timestamp > self.ttl
+                ]
 
-            for key in expired_keys:
-                del self._cache[key]
-                removed += 1
+                for key in expired_keys:
+                    del shard.entries[key]
+                    removed += 1
 
         return removed
 
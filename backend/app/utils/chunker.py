@@ -7,13 +7,19 @@ improves processing speed for long documents.
 """
 
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from dataclasses import dataclass
 
 from ..config import get_settings
 
 
-@dataclass
+# Sentence boundaries: sentence-ending punctuation and whitespace, followed
+# by a capital letter. Leading with the character class (rather than a
+# lookbehind) lets the regex engine skip ahead to candidate positions.
+_SENTENCE_BREAK = re.compile(r'[.!?]\s+(?=[A-Z])')
+
+
+@dataclass(slots=True)
 class TextChunk:
     """A chunk of text with its offset in the original."""
     text: str
@@ -85,9 +91,17 @@ class TextChunker:
 
     def _split_paragraphs(self, text: str) -> List[str]:
         """Split text by paragraph boundaries."""
-        # Split on double newlines, preserving empty paragraphs
-        paragraphs = re.split(r'\n\n', text)
-        return [p for p in paragraphs if p.strip()]
+        # Split on double newlines, dropping blank paragraphs
+        return [p for p in text.split("\n\n") if p and not p.isspace()]
+
+    def _iter_sentences(self, text: str) -> Iterator[str]:
+        """Yield the sentences of a paragraph, without building a list."""
+        start = 0
+        for match in _SENTENCE_BREAK.finditer(text):
+            # The punctuation mark ends the sentence
+            yield text[start:match.start() + 1]
+            start = match.end()
+        yield text[start:]
 
     def _split_by_sentences(
         self,
@@ -96,37 +110,35 @@ class TextChunker:
         para_idx: int
     ) -> List[TextChunk]:
         """Split a long paragraph into sentence-based chunks."""
-        # Sentence-ending patterns (handles abbreviations like Mr., Dr., etc.)
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(sentence_pattern, text)
-
         chunks = []
-        current_chunk = ""
+        # Sentences of the current chunk, joined once when it is emitted;
+        # each is followed by a space in the joined text
+        buffer: List[str] = []
+        buffer_len = 0
         chunk_start = base_offset
 
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= self.max_chunk_size:
-                current_chunk += sentence + " "
-            else:
-                if current_chunk:
-                    chunks.append(TextChunk(
-                        text=current_chunk.strip(),
-                        start_offset=chunk_start,
-                        end_offset=chunk_start + len(current_chunk.strip()),
-                        paragraph_index=para_idx
-                    ))
-                    chunk_start += len(current_chunk)
+        def emit() -> None:
+            chunk = " ".join(buffer).strip()
+            if chunk:
+                chunks.append(TextChunk(
+                    text=chunk,
+                    start_offset=chunk_start,
+                    end_offset=chunk_start + len(chunk),
+                    paragraph_index=para_idx
+                ))
+
+        for sentence in self._iter_sentences(text):
+            if buffer_len + len(sentence) > self.max_chunk_size and buffer:
+                emit()
+                chunk_start += buffer_len
+                buffer.clear()
+                buffer_len = 0
 
-                current_chunk = sentence + " "
+            buffer.append(sentence)
+            buffer_len += len(sentence) + 1
 
         # Don't forget the last chunk
-        if current_chunk.strip():
-            chunks.append(TextChunk(
-                text=current_chunk.strip(),
-                start_offset=chunk_start,
-                end_offset=chunk_start + len(current_chunk.strip()),
-                paragraph_index=para_idx
-            ))
+        emit()
 
         return chunks
 
@@ -167,9 +179,5 @@ class TextChunker:
         Returns:
             Issues with document-relative offsets
         """
-        adjusted = []
-        for issue in issues:
-            adjusted_issue = issue.copy()
-            adjusted_issue["offset"] = issue["offset"] + chunk.start_offset
-            adjusted.append(adjusted_issue)
-        return adjusted
+        start = chunk.start_offset
+        return [{**issue, "offset": issue["offset"] + start} for issue in issues]
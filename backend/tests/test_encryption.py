@@ -0,0 +1,329 @@
+"""
+Encryption Tests.
+
+Tests for the RSA + AES-GCM hybrid encryption service and its middleware.
+"""
+
+import base64
+import os
+
+import orjson
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric.x25519 import (
+    X25519PrivateKey, X25519PublicKey
+)
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.encryption import (
+    BINARY_CONTENT_TYPE, EncryptionMiddleware, EncryptionService, EncryptedPayload
+)
+
+
+@pytest.fixture(scope="module")
+def private_key_path(tmp_path_factory):
+    """Write a freshly generated RSA private key to disk."""
+    private_pem, _ = EncryptionService.generate_key_pair()
+    path = tmp_path_factory.mktemp("keys") / "private.pem"
+    path.write_bytes(private_pem)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def x25519_key_path(tmp_path_factory):
+    """Write a freshly generated X25519 private key to disk."""
+    private_pem = X25519PrivateKey.generate().private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    path = tmp_path_factory.mktemp("keys") / "x25519.pem"
+    path.write_bytes(private_pem)
+    return str(path)
+
+
+@pytest.fixture
+def encryption(private_key_path, x25519_key_path):
+    """Create an initialized encryption service."""
+    service = EncryptionService()
+    assert service.initialize(
+        private_key_path=private_key_path,
+        x25519_private_key_path=x25519_key_path
+    )
+    return service
+
+
+@pytest.fixture
+def client(encryption):
+    """Create a test client for an app behind the encryption middleware."""
+    app = FastAPI()
+    app.add_middleware(EncryptionMiddleware, encryption_svc=encryption)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return JSONResponse(
+            {"received": request.state.decrypted_body},
+            status_code=201
+        )
+
+    @app.get("/result")
+    async def result():
+        return JSONResponse({"text": "Ik heb het boek gelezen."}, status_code=202)
+
+    @app.get("/plain")
+    async def plain():
+        return PlainTextResponse("ok")
+
+    return TestClient(app)
+
+
+def _envelope(encrypted: EncryptedPayload) -> dict:
+    """Build the JSON envelope a client sends for an encrypted payload."""
+    return {
+        "encrypted_key": encrypted.encrypted_key,
+        "encrypted_data": encrypted.encrypted_data,
+        "iv": encrypted.iv,
+        "version": encrypted.version
+    }
+
+
+class TestEncryption:
+    """Test suite for the encryption service."""
+
+    def test_round_trip(self, encryption):
+        """Test that an encrypted payload decrypts to the original data."""
+        data = {"text": "Ik heb de boek gelezen.", "language": "nl"}
+
+        encrypted = encryption.encrypt_payload(data)
+
+        assert encryption.decrypt_payload(encrypted) == data
+
+    def test_aes256_payload_accepted(self, encryption):
+        """Test that 1.0 payloads with a 256-bit session key still decrypt."""
+        data = {"text": "test"}
+        aes_key = os.urandom(32)
+        iv = os.urandom(12)
+        encrypted = EncryptedPayload(
+            encrypted_key=base64.b64encode(
+                encryption._public_key.encrypt(aes_key, encryption._oaep)
+            ).decode("utf-8"),
+            encrypted_data=base64.b64encode(
+                AESGCM(aes_key).encrypt(iv, orjson.dumps(data), None)
+            ).decode("utf-8"),
+            iv=base64.b64encode(iv).decode("utf-8"),
+            version="1.0"
+        )
+
+        assert encryption.decrypt_payload(encrypted) == data
+
+    def test_chacha_round_trip(self, encryption):
+        """Test the ChaCha20-Poly1305 path used without AES hardware."""
+        encryption._use_chacha = True
+        data = {"text": "Ik heb de boek gelezen."}
+
+        encrypted = encryption.encrypt_payload(data)
+
+        assert encrypted.version == "1.0-chacha"
+        assert encryption.decrypt_payload(encrypted) == data
+        assert encryption.decrypt_frame(encryption.encrypt_frame(data)) == data
+
+    def test_x25519_payload_accepted(self, encryption):
+        """Test that 2.0-x25519 payloads decrypt via key agreement."""
+        data = {"text": "Ik heb de boek gelezen."}
+        client_key = X25519PrivateKey.generate()
+        server_public = X25519PublicKey.from_public_bytes(
+            base64.b64decode(encryption.get_x25519_public_key())
+        )
+        aes_key = HKDF(
+            algorithm=hashes.SHA256(), length=32, salt=None, info=b"e2e-aead"
+        ).derive(client_key.exchange(server_public))
+        iv = os.urandom(12)
+        encrypted = EncryptedPayload(
+            encrypted_key=base64.b64encode(
+                client_key.public_key().public_bytes_raw()
+            ).decode("utf-8"),
+            encrypted_data=base64.b64encode(
+                AESGCM(aes_key).encrypt(iv, orjson.dumps(data), None)
+            ).decode("utf-8"),
+            iv=base64.b64encode(iv).decode("utf-8"),
+            version="2.0-x25519"
+        )
+
+        assert encryption.decrypt_payload(encrypted) == data
+
+    def test_x25519_disabled_without_key_file(self, private_key_path):
+        """Test that no per-process X25519 key is generated when none is configured."""
+        service = EncryptionService()
+
+        assert service.initialize(private_key_path=private_key_path)
+        assert service.get_x25519_public_key() is None
+
+    def test_missing_x25519_key_file_disables_x25519(self, private_key_path, tmp_path):
+        """Test that a configured but missing X25519 key is not replaced by a random one."""
+        service = EncryptionService()
+
+        assert service.initialize(
+            private_key_path=private_key_path,
+            x25519_private_key_path=str(tmp_path / "missing.pem")
+        )
+        assert service.get_x25519_public_key() is None
+
+    def test_non_x25519_key_file_disables_x25519(self, private_key_path):
+        """Test that a key file holding another key type is rejected for X25519."""
+        service = EncryptionService()
+
+        assert service.initialize(
+            private_key_path=private_key_path,
+            x25519_private_key_path=private_key_path  # An RSA key
+        )
+        assert service.get_x25519_public_key() is None
+
+    def test_malformed_x25519_key_file_disables_x25519(self, private_key_path, tmp_path):
+        """Test that an unparseable X25519 key file leaves RSA encryption working."""
+        x25519_path = tmp_path / "x25519.pem"
+        x25519_path.write_bytes(b"not a PEM file")
+        service = EncryptionService()
+
+        assert service.initialize(
+            private_key_path=private_key_path,
+            x25519_private_key_path=str(x25519_path)
+        )
+        assert service.is_available
+        assert service.get_x25519_public_key() is None
+
+    def test_tampered_ciphertext_rejected(self, encryption):
+        """Test that GCM authentication rejects modified ciphertext."""
+        encrypted = encryption.encrypt_payload({"text": "test"})
+
+        data = bytearray(base64.b64decode(encrypted.encrypted_data))
+        data[0] ^= 0x01
+        tampered = EncryptedPayload(
+            encrypted_key=encrypted.encrypted_key,
+            encrypted_data=base64.b64encode(bytes(data)).decode("utf-8"),
+            iv=encrypted.iv,
+            version=encrypted.version
+        )
+
+        with pytest.raises(ValueError):
+            encryption.decrypt_payload(tampered)
+
+    def test_public_key_pem(self, encryption):
+        """Test that the public key is exposed in PEM format."""
+        pem = encryption.get_public_key_pem()
+
+        assert pem.startswith("-----BEGIN PUBLIC KEY-----")
+
+    def test_session_key_reused(self, encryption):
+        """Test that a repeated wrapped key is unwrapped only once."""
+        encrypted = encryption.encrypt_payload({"text": "test"})
+
+        encryption.decrypt_payload(encrypted)
+        encryption.decrypt_payload(encrypted)
+
+        assert len(encryption._session_keys) == 1
+
+    def test_binary_frame_round_trip(self, encryption):
+        """Test that a binary frame decrypts to the original data."""
+        data = {"text": "Ik heb de boek gelezen.", "issues": [1, 2, 3]}
+
+        frame = encryption.encrypt_frame(data)
+
+        assert encryption.decrypt_frame(frame) == data
+
+    def test_truncated_binary_frame_rejected(self, encryption):
+        """Test that a truncated frame is rejected."""
+        frame = encryption.encrypt_frame({"text": "test"})
+
+        with pytest.raises(ValueError):
+            encryption.decrypt_frame(frame[:100])
+
+
+class TestEncryptionMiddleware:
+    """Test suite for the encryption ASGI middleware."""
+
+    def test_encrypted_request_decrypted_for_handler(self, client, encryption):
+        """Test that an encrypted JSON request reaches the handler decrypted."""
+        data = {"text": "Ik heb de boek gelezen.", "language": "nl"}
+
+        response = client.post(
+            "/echo",
+            content=orjson.dumps(_envelope(encryption.encrypt_payload(data))),
+            headers={"Content-Type": "application/x-encrypted"}
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"received": data}
+
+    def test_binary_frame_request_decrypted_for_handler(self, client, encryption):
+        """Test that a binary-framed request reaches the handler decrypted."""
+        data = {"text": "Ik heb de boek gelezen."}
+
+        response = client.post(
+            "/echo",
+            content=encryption.encrypt_frame(data),
+            headers={"Content-Type": BINARY_CONTENT_TYPE}
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"received": data}
+
+    def test_json_response_encrypted(self, client, encryption):
+        """Test that a JSON response is encrypted with its status code kept."""
+        response = client.get(
+            "/result",
+            headers={"Accept": "application/x-encrypted"}
+        )
+
+        assert response.status_code == 202
+        assert response.headers["content-type"] == "application/x-encrypted+json"
+        assert int(response.headers["content-length"]) == len(response.content)
+        envelope = response.json()
+        encrypted = EncryptedPayload(
+            envelope["encrypted_key"],
+            envelope["encrypted_data"],
+            envelope["iv"],
+            envelope["version"]
+        )
+        assert encryption.decrypt_payload(encrypted) == {
+            "text": "Ik heb het boek gelezen."
+        }
+
+    def test_binary_frame_response(self, client, encryption):
+        """Test that a binary framed response is sent when requested."""
+        response = client.get(
+            "/result",
+            headers={"Accept": BINARY_CONTENT_TYPE}
+        )
+
+        assert response.status_code == 202
+        assert response.headers["content-type"] == BINARY_CONTENT_TYPE
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert encryption.decrypt_frame(response.content) == {
+            "text": "Ik heb het boek gelezen."
+        }
+
+    def test_non_json_response_not_encrypted(self, client):
+        """Test that non-JSON responses pass through unencrypted."""
+        response = client.get(
+            "/plain",
+            headers={"Accept": "application/x-encrypted"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == "ok"
+
+    def test_undecryptable_request_rejected(self, client):
+        """Test that a request body that cannot be decrypted returns 400."""
+        response = client.post(
+            "/echo",
+            content=b"not an encrypted payload",
+            headers={"Content-Type": "application/x-encrypted"}
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Failed to decrypt request"}
@@ -4,12 +4,15 @@ Pipeline Integration Tests.
 Tests for the complete grammar checking pipeline.
 """
 
+import asyncio
+import gc
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.models.request import CheckRequest, CheckMode, Tone
 from app.models.response import GrammarIssue, IssueCategory, IssueSeverity
-from app.services.pipeline import GrammarPipeline
+from app.services.pipeline import GrammarPipeline, MAX_PROMPT_ISSUES
 from app.services.validator import ValidationService, ValidationResult
 
 
@@ -104,6 +107,287 @@ class TestPipeline:
         assert "loopt" in result
         assert "het werk" in result
 
+    def test_explanations_to_issues_repeated_phrase(self):
+        """Test that repeated phrases map to successive occurrences."""
+        from app.models.response import Explanation
+
+        pipeline = GrammarPipeline()
+        text = "Ik zag de boek en de werk."
+        explanations = [
+            Explanation(span="de", original="de", corrected="het", reason="het-woord"),
+            Explanation(span="de", original="de", corrected="het", reason="het-woord")
+        ]
+
+        issues = pipeline._explanations_to_issues(text, explanations)
+
+        assert [issue.offset for issue in issues] == [7, 18]
+
+    def test_prompt_issues_deduplicated_and_capped(self):
+        """Test that the LLM prompt gets unique, non-style issues, most severe first."""
+        pipeline = GrammarPipeline()
+
+        def make(offset, category, severity, rule_id="RULE"):
+            return GrammarIssue(
+                offset=offset,
+                length=1,
+                message="Issue",
+                rule_id=rule_id,
+                category=category,
+                severity=severity,
+                original_text="x",
+                suggestions=["y"]
+            )
+
+        grammar = make(0, IssueCategory.GRAMMAR, IssueSeverity.ERROR)
+        style = make(2, IssueCategory.STYLE, IssueSeverity.STYLE)
+        selected = pipeline._select_prompt_issues([grammar, grammar, style], CheckMode.STRICT)
+        assert selected == [grammar]
+
+        selected = pipeline._select_prompt_issues([style], CheckMode.STRICT)
+        assert selected == [style]
+
+        hints = [
+            make(i, IssueCategory.GRAMMAR, IssueSeverity.HINT, f"H{i}")
+            for i in range(MAX_PROMPT_ISSUES)
+        ]
+        error = make(100, IssueCategory.GRAMMAR, IssueSeverity.ERROR)
+        selected = pipeline._select_prompt_issues(hints + [error], CheckMode.STRICT)
+        assert len(selected) == MAX_PROMPT_ISSUES
+        assert selected[-1] is error
+        assert [i.offset for i in selected] == sorted(i.offset for i in selected)
+
+    @pytest.mark.asyncio
+    async def test_simple_spelling_fix_skips_llm(self):
+        """Test that single-suggestion spelling fixes bypass the LLM in strict mode."""
+        pipeline = GrammarPipeline()
+        pipeline.languagetool.check_text = AsyncMock(return_value=[
+            GrammarIssue(
+                offset=7,
+                length=4,
+                message="Spelling",
+                rule_id="SPELLER",
+                category=IssueCategory.SPELLING,
+                severity=IssueSeverity.ERROR,
+                original_text="boke",
+                suggestions=["boek"]
+            )
+        ])
+        pipeline.llm.generate_correction = AsyncMock()
+
+        result = await pipeline.process(CheckRequest(
+            text="Ik heb boke gelezen.",
+            language="nl",
+            mode=CheckMode.STRICT
+        ))
+
+        pipeline.llm.generate_correction.assert_not_awaited()
+        assert result.corrected_text == "Ik heb boek gelezen."
+        assert result.explanations[0].corrected == "boek"
+        assert result.fallback_used
+        assert not result.validation_passed
+
+    @pytest.mark.asyncio
+    async def test_style_mode_reuses_speculative_llm_call(self, sample_request):
+        """Test that the concurrent LLM pass is used when LanguageTool finds nothing."""
+        pipeline = GrammarPipeline()
+        pipeline.languagetool.check_text = AsyncMock(return_value=[])
+        pipeline.llm.generate_rewrites_only = AsyncMock(return_value=None)
+
+        result = await pipeline.process(sample_request)
+
+        pipeline.llm.generate_rewrites_only.assert_awaited_once()
+        assert result.corrected_text == sample_request.text
+
+    @pytest.mark.asyncio
+    async def test_speculative_llm_call_cancelled_on_issues(
+        self, sample_request, mock_issues
+    ):
+        """Test that the concurrent LLM pass is cancelled when issues are found."""
+        pipeline = GrammarPipeline()
+        cancelled = asyncio.Event()
+
+        async def slow_rewrites(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def check_text(text, language):
+            await asyncio.sleep(0)  # Let the speculative call start
+            return mock_issues
+
+        pipeline.languagetool.check_text = check_text
+        pipeline.llm.generate_rewrites_only = slow_rewrites
+        pipeline.llm.generate_correction = AsyncMock(return_value=None)
+
+        result = await pipeline.process(sample_request)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert result.fallback_used
+
+    @pytest.mark.asyncio
+    async def test_speculative_llm_call_cancelled_on_unexpected_error(
+        self, sample_request
+    ):
+        """Test that the concurrent LLM pass is cancelled when LanguageTool raises."""
+        pipeline = GrammarPipeline()
+        cancelled = asyncio.Event()
+
+        async def slow_rewrites(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def check_text(text, language):
+            await asyncio.sleep(0)  # Let the speculative call start
+            raise RuntimeError("unexpected")
+
+        pipeline.languagetool.check_text = check_text
+        pipeline.llm.generate_rewrites_only = slow_rewrites
+
+        with pytest.raises(RuntimeError):
+            await pipeline.process(sample_request)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+
+class TestLanguageTool:
+    """Test suite for the LanguageTool service."""
+
+    @pytest.mark.asyncio
+    async def test_long_text_checked_in_chunks(self):
+        """Test that chunked LanguageTool checks report document offsets."""
+        from app.services.languagetool import LanguageToolService
+
+        service = LanguageToolService()
+        paragraph = "Ik heb de boek gelezen. " * 40
+        text = "\n\n".join([paragraph.strip()] * 6)
+        requests = []
+
+        async def check(chunk, lt_language, language):
+            requests.append(chunk)
+            return [
+                {"offset": i, "length": 2, "rule": {"id": "DE_HET"}}
+                for i in range(len(chunk)) if chunk.startswith("de boek", i)
+            ]
+
+        service._check = check
+
+        issues = await service.check_text(text, "nl")
+
+        assert len(requests) > 1
+        assert len(issues) == text.count("de boek")
+        assert all(text[i.offset:i.offset + 2] == "de" for i in issues)
+
+    def test_matches_outside_issue_bounds_dropped(self):
+        """Test that empty or negative-offset matches do not become issues."""
+        from app.services.languagetool import LanguageToolService
+
+        service = LanguageToolService()
+        matches = [
+            {"offset": 7, "length": 2, "rule": {"id": "DE_HET"}},
+            {"offset": 7, "length": 0, "rule": {"id": "EMPTY"}},
+            {"offset": -1, "length": 2, "rule": {"id": "NEGATIVE"}},
+        ]
+
+        issues = service._parse_matches(matches, "Ik heb de boek gelezen.")
+
+        assert [issue.rule_id for issue in issues] == ["DE_HET"]
+        assert issues[0].original_text == "de"
+
+    @pytest.mark.asyncio
+    async def test_short_paragraphs_merged_into_chunks(self):
+        """Test that many short paragraphs are sent as a few merged chunks."""
+        from app.services.languagetool import LanguageToolService
+
+        service = LanguageToolService()
+        text = "\n\n".join(f"Ik heb de boek {i} gelezen." for i in range(150))
+        requests = []
+
+        async def check(chunk, lt_language, language):
+            requests.append(chunk)
+            return [
+                {"offset": i, "length": 2, "rule": {"id": "DE_HET"}}
+                for i in range(len(chunk)) if chunk.startswith("de boek", i)
+            ]
+
+        service._check = check
+
+        issues = await service.check_text(text, "nl")
+
+        max_size = service.chunker.max_chunk_size
+        assert len(text) > service.chunk_threshold
+        assert len(requests) == -(-len(text) // max_size)  # ceil
+        assert all(len(chunk) <= max_size for chunk in requests)
+        assert len(issues) == 150
+        assert all(text[i.offset:i.offset + 2] == "de" for i in issues)
+
+    @pytest.mark.asyncio
+    async def test_languagetool_results_cached(self):
+        """Test that resubmitted text is served from the result cache."""
+        from app.services.languagetool import LanguageToolService
+
+        service = LanguageToolService()
+        service._check = AsyncMock(return_value=[])
+
+        await service.check_text("Ik heb de boek gelezen.", "nl")
+        await service.check_text("Ik heb de boek gelezen.", "nl")
+        await service.check_text("Ik heb de boek gelezen.", "en")
+
+        assert service._check.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_checks_coalesced(self):
+        """Test that identical checks in flight together share one request."""
+        from app.services.languagetool import LanguageToolService
+
+        service = LanguageToolService()
+
+        async def check(text, lt_language, language):
+            await asyncio.sleep(0.01)
+            return []
+
+        service._check = AsyncMock(side_effect=check)
+
+        await asyncio.gather(*(
+            service.check_text("Ik heb de boek gelezen.", "nl") for _ in range(5)
+        ))
+
+        assert service._check.await_count == 1
+        assert not service._inflight
+
+    @pytest.mark.asyncio
+    async def test_failed_check_without_waiters_not_reported(self):
+        """Test that a coalesced check failing after all waiters left is not logged."""
+        from app.services.languagetool import LanguageToolService, LanguageToolError
+
+        service = LanguageToolService()
+        unhandled = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+
+        async def check(text, lt_language, language):
+            await asyncio.sleep(0.01)
+            raise LanguageToolError("down")
+
+        service._check = AsyncMock(side_effect=check)
+
+        waiter = asyncio.create_task(service.check_text("Ik heb de boek gelezen.", "nl"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        del waiter
+        gc.collect()
+
+        assert not service._inflight
+        assert not unhandled
+
 
 class TestValidation:
     """Test suite for the validation service."""
@@ -202,6 +486,138 @@ class TestValidation:
         is_similar = validation_service._is_similar_issue(issue, original)
         assert is_similar
 
+    @pytest.mark.asyncio
+    async def test_validate_many(self, mock_languagetool):
+        """Test that candidates are validated together, in order."""
+        from app.services.languagetool import LanguageToolError
+
+        new_error = GrammarIssue(
+            offset=0,
+            length=2,
+            message="New error",
+            rule_id="NEW_ERROR",
+            category=IssueCategory.GRAMMAR,
+            severity=IssueSeverity.ERROR,
+            original_text="Ik",
+            suggestions=["ik"]
+        )
+
+        async def check_text(text, language):
+            if text == "broken":
+                raise LanguageToolError("down")
+            return [new_error] if text == "bad" else []
+
+        mock_languagetool.check_text = check_text
+        validation_service = ValidationService(mock_languagetool)
+
+        results = await validation_service.validate_many(
+            ["good", "bad", "broken"], [], "nl"
+        )
+
+        assert [r.is_valid for r in results] == [True, False, False]
+        assert results[1].new_issues == [new_error]
+
+    @pytest.mark.asyncio
+    async def test_llm_text_matching_fallback_skips_recheck(
+        self, validation_service, mock_languagetool
+    ):
+        """Test that LLM output equal to the fallback is accepted without LanguageTool."""
+        text, used_fallback, result = await validation_service.validate_and_choose(
+            llm_text="Ik heb het  boek gelezen. ",
+            fallback_text="Ik heb het boek gelezen.",
+            original_issues=[],
+            language="nl"
+        )
+
+        assert text == "Ik heb het boek gelezen."
+        assert not used_fallback
+        assert result.is_valid
+        mock_languagetool.check_text.assert_not_called()
+
+
+class TestLLMStreaming:
+    """Test suite for streamed LLM completions."""
+
+    def test_scanner_ignores_braces_in_strings(self):
+        """Test that braces inside JSON strings do not close the object."""
+        from app.services.llm import JSONObjectScanner
+
+        scanner = JSONObjectScanner()
+
+        assert not scanner.feed('{"corrected_text": "a } \\" {", ')
+        assert not scanner.feed('"rewrites": [{"text": "b"}]')
+        assert scanner.feed('} trailing')
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_at_closing_brace(self):
+        """Test that a streamed completion is cut off once the JSON closes."""
+        import json
+
+        import httpx
+
+        from app.services.llm import LLMService
+
+        deltas = ['Here: {"corrected_text": ', '"Ik heb het boek."', '}', ' Extra']
+        body = "".join(
+            f"data: {json.dumps({'choices': [{'delta': {'content': d}}]})}\n\n"
+            for d in deltas
+        ) + "data: [DONE]\n\n"
+
+        def handler(request):
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(
+                200, text=body, headers={"content-type": "text/event-stream"}
+            )
+
+        service = LLMService()
+        service.stream = True
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        content = await service._call_llm("prompt")
+        await service.aclose()
+
+        assert content == 'Here: {"corrected_text": "Ik heb het boek."}'
+
+
+class TestLLMService:
+    """Test suite for the LLM service."""
+
+    @pytest.mark.asyncio
+    async def test_only_parsed_completions_cached(self):
+        """Test that an unparseable completion is requested again, not replayed."""
+        from app.services.llm import LLMService
+
+        service = LLMService()
+        service._call_llm = AsyncMock(side_effect=[
+            "Sorry, I cannot help with that.",
+            '{"corrected_text": "Ik heb het boek gelezen."}',
+        ])
+
+        first = await service.generate_rewrites_only("Ik heb het boek gelezen.")
+        second = await service.generate_rewrites_only("Ik heb het boek gelezen.")
+        third = await service.generate_rewrites_only("Ik heb het boek gelezen.")
+
+        assert first is None
+        assert second.corrected_text == "Ik heb het boek gelezen."
+        assert third.corrected_text == "Ik heb het boek gelezen."
+        assert service._call_llm.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_discarded_completion_requested_again(self):
+        """Test that a completion rejected by validation is not replayed."""
+        from app.services.llm import LLMService
+
+        service = LLMService()
+        service._call_llm = AsyncMock(
+            return_value='{"corrected_text": "Ik heb het boek gelezen."}'
+        )
+
+        first = await service.generate_rewrites_only("Ik heb het boek gelezen.")
+        service.discard(first)
+        await service.generate_rewrites_only("Ik heb het boek gelezen.")
+
+        assert service._call_llm.await_count == 2
+
 
 class TestCaching:
     """Test suite for caching functionality."""
@@ -255,3 +671,94 @@ class TestCaching:
 
         assert stats["hits"] == 1
         assert stats["misses"] == 1
+
+    def test_cache_stays_within_capacity(self):
+        """Test that the sharded cache evicts to stay within max_entries."""
+        from app.utils.cache import GrammarCache
+
+        cache = GrammarCache(max_entries=64)
+
+        for i in range(500):
+            cache.set(f"text {i}", "nl", i, "strict")
+
+        stats = cache.get_stats()
+
+        assert stats["entries"] <= 64
+        assert stats["evictions"] == 500 - stats["entries"]
+        assert cache.get("text 499", "nl", "strict") == 499
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that a recently read entry survives eviction."""
+        from app.utils.cache import GrammarCache, SHARD_COUNT
+
+        cache = GrammarCache(max_entries=SHARD_COUNT * 10)  # 10 per shard
+
+        # Texts that land in the same shard as "first"
+        shard = cache._shard(cache._make_key("first", "nl"))
+        texts = [
+            text for text in (f"text {i}" for i in range(2000))
+            if cache._shard(cache._make_key(text, "nl")) is shard
+        ][:10]
+
+        cache.set("first", "nl", "first")
+        for text in texts[:9]:
+            cache.set(text, "nl", text)
+        assert cache.get("first", "nl") == "first"
+
+        cache.set(texts[9], "nl", texts[9])  # Shard full: evicts one entry
+
+        assert cache.get("first", "nl") == "first"
+        assert cache.get(texts[0], "nl") is None
+
+    def test_cleanup_expired(self):
+        """Test that expired entries are removed and fresh ones kept."""
+        from app.utils.cache import GrammarCache
+
+        cache = GrammarCache(ttl=10)
+
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            for i in range(20):
+                cache.set(f"old {i}", "nl", i)
+        with patch("app.utils.cache.time.monotonic", return_value=1008.0):
+            cache.set("new", "nl", "new")
+
+        with patch("app.utils.cache.time.monotonic", return_value=1015.0):
+            removed = cache.cleanup_expired()
+            assert cache.get("new", "nl") == "new"
+
+        assert removed == 20
+        assert cache.get_stats()["entries"] == 1
+
+    def test_cleanup_expired_after_recent_reads(self):
+        """Test that expired entries read after fresh ones are still removed."""
+        from app.utils.cache import GrammarCache
+
+        cache = GrammarCache(ttl=10)
+
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            for i in range(20):
+                cache.set(f"old {i}", "nl", i)
+        with patch("app.utils.cache.time.monotonic", return_value=1008.0):
+            for i in range(20):
+                cache.set(f"new {i}", "nl", i)
+        with patch("app.utils.cache.time.monotonic", return_value=1009.0):
+            for i in range(20):
+                assert cache.get(f"old {i}", "nl") == i  # Now most recently used
+
+        with patch("app.utils.cache.time.monotonic", return_value=1015.0):
+            removed = cache.cleanup_expired()
+
+        assert removed == 20
+        assert cache.get_stats()["entries"] == 20
+
+    def test_cache_overwrite_does_not_evict(self):
+        """Test that re-setting a cached key at capacity evicts nothing."""
+        from app.utils.cache import GrammarCache, SHARD_COUNT
+
+        cache = GrammarCache(max_entries=SHARD_COUNT)  # One entry per shard
+
+        cache.set("test", "nl", 1, "strict")
+        cache.set("test", "nl", 2, "strict")
+
+        assert cache.get("test", "nl", "strict") == 2
+        assert cache.get_stats()["evictions"] == 0
@@ -40,8 +40,12 @@ openssl genrsa -out "$KEYS_DIR/private.pem" 2048
 # Extract public key
 openssl rsa -in "$KEYS_DIR/private.pem" -pubout -out "$KEYS_DIR/public.pem"
 
+# Generate X25519 key for 2.0-x25519 clients
+openssl genpkey -algorithm X25519 -out "$KEYS_DIR/x25519.pem"
+
 # Set permissions (restrictive for private key)
 chmod 600 "$KEYS_DIR/private.pem"
+chmod 600 "$KEYS_DIR/x25519.pem"
 chmod 644 "$KEYS_DIR/public.pem"
 
 echo ""
@@ -51,6 +55,7 @@ echo "=============================================="
 echo ""
 echo "  Private key: $KEYS_DIR/private.pem"
 echo "  Public key:  $KEYS_DIR/public.pem"
+echo "  X25519 key:  $KEYS_DIR/x25519.pem"
 echo ""
 echo "IMPORTANT:"
 echo "  - Keep the private key secure and never commit it to git"